@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from array import array
+
+
+class DisjointSet:
+    # Union-find over 0..size-1 with union by size and path halving.
+    def __init__(self, size: int) -> None:
+        self._parent = array("q", range(size))
+        self._sizes = array("q", [1]) * size
+        self.components = size
+
+    def __len__(self) -> int:
+        return len(self._parent)
+
+    def find(self, item: int) -> int:
+        parent = self._parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a: int, b: int) -> bool:
+        # Returns False when both items were already in the same component.
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return False
+        if self._sizes[root_a] < self._sizes[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        self._sizes[root_a] += self._sizes[root_b]
+        self.components -= 1
+        return True
+
+    def connected(self, a: int, b: int) -> bool:
+        return self.find(a) == self.find(b)
+
+    def size(self, item: int) -> int:
+        return self._sizes[self.find(item)]
+
+    def component_sizes(self) -> list[int]:
+        return sorted(
+            (self._sizes[item] for item in range(len(self._parent)) if self._parent[item] == item),
+            reverse=True,
+        )
+
+    def groups(self) -> list[list[int]]:
+        members: dict[int, list[int]] = {}
+        for item in range(len(self._parent)):
+            members.setdefault(self.find(item), []).append(item)
+        return list(members.values())
+
+
+__all__ = ["DisjointSet"]
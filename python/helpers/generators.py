@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import math
+import random
+from typing import Callable, Sequence
+
+# A day's generator module (solutions/dayNN/generator.py) exposes generate(size, rng) -> str.
+# `size` is the rough number of input elements (cells, rows or points) and every random
+# choice must come from `rng`, so a seed always reproduces the same input.
+InputGenerator = Callable[[int, random.Random], str]
+
+
+def grid_input(
+    size: int,
+    rng: random.Random,
+    alphabet: str = ".#",
+    weights: Sequence[float] | None = None,
+    width: int | None = None,
+) -> str:
+    # About `size` cells for load_grid: square unless a width is given.
+    width = width or max(1, math.isqrt(size))
+    height = max(1, size // width)
+    rows = ("".join(rng.choices(alphabet, weights, k=width)) for _ in range(height))
+    return "\n".join(rows) + "\n"
+
+
+def token_rows(
+    size: int,
+    rng: random.Random,
+    columns: int = 2,
+    low: int = 0,
+    high: int = 99_999,
+    separator: str = " ",
+) -> str:
+    # `size` rows of integer tokens for load_items / load_columns.
+    rows = (
+        separator.join(str(rng.randint(low, high)) for _ in range(columns)) for _ in range(size)
+    )
+    return "\n".join(rows) + "\n"
+
+
+__all__ = [
+    "InputGenerator",
+    "grid_input",
+    "token_rows",
+]
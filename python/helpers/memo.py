@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import functools
+import weakref
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Sequence, TypeVar
+
+R = TypeVar("R")
+
+DEFAULT_MAXSIZE = 1_000_000
+
+_MISSING = object()
+_MEMOS: "weakref.WeakSet[SolveMemo[Any]]" = weakref.WeakSet()
+_LAST_STATS: list[CacheStats] = []
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    name: str
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int | None
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def describe(self) -> str:
+        limit = "unbounded" if self.maxsize is None else str(self.maxsize)
+        return (
+            f"{self.name}: {self.hits} hits / {self.misses} misses ({self.hit_rate:.1%}), "
+            f"{self.size}/{limit} entries, {self.evictions} evictions"
+        )
+
+
+class SolveMemo(Generic[R]):
+    def __init__(self, function: Callable[..., R], maxsize: int | None = DEFAULT_MAXSIZE) -> None:
+        functools.update_wrapper(self, function)
+        self._function = function
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Any, R] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        _MEMOS.add(self)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> R:
+        key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+        entries = self._entries
+        value = entries.get(key, _MISSING)
+        if value is not _MISSING:
+            self.hits += 1
+            if self._maxsize is not None:
+                entries.move_to_end(key)
+            return value  # type: ignore[return-value]
+
+        self.misses += 1
+        value = self._function(*args, **kwargs)
+        entries[key] = value
+        if self._maxsize is not None and len(entries) > self._maxsize:
+            entries.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Callable[..., R]:
+        if instance is None:
+            return self
+        return functools.partial(self.__call__, instance)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            getattr(self, "__qualname__", repr(self._function)),
+            self.hits,
+            self.misses,
+            self.evictions,
+            len(self._entries),
+            self._maxsize,
+        )
+
+
+def solve_memo(
+    function: Callable[..., R] | None = None, *, maxsize: int | None = DEFAULT_MAXSIZE
+) -> Any:
+    # Usable bare (@solve_memo) or configured (@solve_memo(maxsize=10_000)).
+    if function is not None:
+        return SolveMemo(function, maxsize)
+    return lambda inner: SolveMemo(inner, maxsize)
+
+
+def reset_solve_memos() -> None:
+    _LAST_STATS.clear()
+    for memo in list(_MEMOS):
+        memo.clear()
+
+
+def release_solve_memos() -> None:
+    # Runs when a solve finishes: its stats are kept for the runner, while the entries (and
+    # anything their keys reference) are dropped so long-lived processes do not hold them.
+    stats = solve_memo_stats()
+    reset_solve_memos()
+    _LAST_STATS.extend(stats)
+
+
+def last_solve_memo_stats() -> list[CacheStats]:
+    return list(_LAST_STATS)
+
+
+def solve_memo_stats() -> list[CacheStats]:
+    stats = [memo.stats() for memo in list(_MEMOS)]
+    return sorted((entry for entry in stats if entry.hits or entry.misses), key=lambda s: s.name)
+
+
+class DPTable:
+    def __init__(self, shape: Sequence[int], fill: int | float = 0, typecode: str = "q") -> None:
+        if not shape or any(dimension <= 0 for dimension in shape):
+            raise ValueError("DPTable dimensions must be positive.")
+        self.shape = tuple(shape)
+        strides = []
+        stride = 1
+        for dimension in reversed(self.shape):
+            strides.append(stride)
+            stride *= dimension
+        self._strides = tuple(reversed(strides))
+        self.values = array(typecode, [fill]) * stride
+
+    def offset(self, index: int | Sequence[int]) -> int:
+        if isinstance(index, int):
+            return index
+        if len(index) != len(self.shape):
+            raise IndexError("DPTable index has the wrong number of dimensions.")
+        offset = 0
+        for position, dimension, stride in zip(index, self.shape, self._strides):
+            if not 0 <= position < dimension:
+                raise IndexError("DPTable index out of range.")
+            offset += position * stride
+        return offset
+
+    def __getitem__(self, index: int | Sequence[int]) -> Any:
+        return self.values[self.offset(index)]
+
+    def __setitem__(self, index: int | Sequence[int], value: Any) -> None:
+        self.values[self.offset(index)] = value
+
+    def row(self, *prefix: int) -> memoryview:
+        # A writable view over the innermost run that starts at the given leading indices.
+        start = self.offset(tuple(prefix) + (0,) * (len(self.shape) - len(prefix)))
+        length = self._strides[len(prefix) - 1] if prefix else len(self.values)
+        return memoryview(self.values)[start : start + length]
+
+
+__all__ = [
+    "CacheStats",
+    "DPTable",
+    "SolveMemo",
+    "last_solve_memo_stats",
+    "release_solve_memos",
+    "reset_solve_memos",
+    "solve_memo",
+    "solve_memo_stats",
+]
@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import functools
+import math
+import os
+import sys
+import weakref
+from array import array
+from collections import OrderedDict
+from multiprocessing import shared_memory
+from typing import Any, Callable, Generic, Iterable, Iterator, Sequence, TypeVar
+
+from models import Grid, Point
+
+T = TypeVar("T")
+R = TypeVar("R")
+B = TypeVar("B", bound="_SharedBuffer")
+
+# Workers attach each segment once and reuse the view for later chunks that mention it.
+# After every chunk only the most recently used attachments stay mapped, so long-lived
+# workers (a reused executor, the solver daemon) do not keep every unlinked grid alive.
+_ATTACHED: OrderedDict[str, "_SharedBuffer"] = OrderedDict()
+_MAX_ATTACHED = 4
+# Evicted attachments that a worker function still holds a view into (a cached slice, a
+# numpy.frombuffer array). They cannot be unmapped yet; later trims retry until they can.
+_UNCLOSED: list[shared_memory.SharedMemory] = []
+
+# Chunks per worker when no chunk size is given: enough to balance uneven candidates, few
+# enough that per-task overhead stays negligible.
+_CHUNKS_PER_WORKER = 4
+
+
+def _open_segment(name: str) -> shared_memory.SharedMemory:
+    if sys.version_info >= (3, 13):
+        # The owner's resource tracker already owns the segment; attachments must not.
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+def _release(segment: shared_memory.SharedMemory, view: memoryview, owner: bool) -> None:
+    try:
+        view.release()
+        segment.close()
+    except BufferError:
+        # Owners see the error from close(); attachments are closed between chunks, where
+        # it would replace the chunk's own result.
+        if owner:
+            raise
+        _UNCLOSED.append(segment)
+        return
+    if owner:
+        try:
+            segment.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class _SharedBuffer:
+    # One shared-memory segment holding a flat typed array. The process that publishes it
+    # owns the segment and unlinks it on close(); pickled copies re-attach by name in the
+    # receiving process and only ever get a read-only view.
+    def __init__(
+        self, segment: shared_memory.SharedMemory, typecode: str, length: int, owner: bool
+    ) -> None:
+        self._segment = segment
+        self.typecode = typecode
+        self.length = length
+        self.owner = owner
+        itemsize = array(typecode).itemsize
+        view = segment.buf[: length * itemsize].toreadonly().cast(typecode)
+        self.data = view
+        self._finalizer = weakref.finalize(self, _release, segment, view, owner)
+
+    @staticmethod
+    def _publish(values: array) -> shared_memory.SharedMemory:
+        raw = memoryview(values).cast("B")
+        # Zero-length segments are rejected, so empty arrays still reserve one byte.
+        segment = shared_memory.SharedMemory(create=True, size=max(1, raw.nbytes))
+        segment.buf[: raw.nbytes] = raw
+        return segment
+
+    @property
+    def name(self) -> str:
+        return self._segment.name
+
+    def close(self) -> None:
+        # Safe to call twice; the finalizer also runs at garbage collection and interpreter exit.
+        self._finalizer()
+
+    def __enter__(self: B) -> B:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.length
+
+
+class SharedArray(_SharedBuffer):
+    @staticmethod
+    def publish(values: Iterable[int | float], typecode: str = "q") -> "SharedArray":
+        packed = values if isinstance(values, array) else array(typecode, values)
+        segment = _SharedBuffer._publish(packed)
+        return SharedArray(segment, packed.typecode, len(packed), owner=True)
+
+    def __getitem__(self, index: int) -> Any:
+        return self.data[index]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.data)
+
+    def tolist(self) -> list[Any]:
+        return self.data.tolist()
+
+    def __reduce__(self):
+        return _attach, (SharedArray, self.name, self.typecode, self.length, ())
+
+
+class SharedGrid(_SharedBuffer, Generic[T]):
+    # Single-character grids are stored as latin-1 bytes and int grids as int64, the same
+    # encodings CompactGrid uses; get/get_at decode back to the original cell values.
+    def __init__(
+        self,
+        segment: shared_memory.SharedMemory,
+        typecode: str,
+        length: int,
+        owner: bool,
+        height: int,
+        width: int,
+    ) -> None:
+        super().__init__(segment, typecode, length, owner)
+        self.height = height
+        self.width = width
+        self._chars = typecode == "B"
+
+    @staticmethod
+    def publish(grid: Grid[T] | Sequence[Sequence[T]]) -> "SharedGrid[T]":
+        rows = list(grid)
+        if not rows or not rows[0]:
+            raise ValueError("Grid must have at least one row and column.")
+        width = len(rows[0])
+        if any(len(row) != width for row in rows):
+            raise ValueError("SharedGrid requires every row to have the same length.")
+        cells = [value for row in rows for value in row]
+        if all(type(value) is str and len(value) == 1 and ord(value) < 256 for value in cells):
+            packed = array("B", map(ord, cells))
+        elif all(type(value) is int for value in cells):
+            packed = array("q", cells)
+        else:
+            raise TypeError("Only single-character or int64 grids can be shared.")
+        segment = _SharedBuffer._publish(packed)
+        return SharedGrid(segment, packed.typecode, len(packed), True, len(rows), width)
+
+    def index_of(self, point: Point) -> int:
+        return point.x * self.width + point.y
+
+    def point_of(self, index: int) -> Point:
+        return Point(*divmod(index, self.width))
+
+    def out_of_bounds(self, point: Point) -> bool:
+        return not (0 <= point.x < self.height and 0 <= point.y < self.width)
+
+    def get_at(self, index: int) -> T:
+        value = self.data[index]
+        return chr(value) if self._chars else value  # type: ignore[return-value]
+
+    def get(self, point: Point) -> T | None:
+        if self.out_of_bounds(point):
+            return None
+        return self.get_at(point.x * self.width + point.y)
+
+    def find_items(self, target: T) -> list[Point]:
+        code = ord(target) if self._chars else target  # type: ignore[arg-type]
+        width = self.width
+        return [
+            Point(*divmod(index, width)) for index, value in enumerate(self.data) if value == code
+        ]
+
+    def to_grid(self) -> Grid[T]:
+        # A private, writable copy for workers that need to mutate (e.g. place an obstacle).
+        return Grid(list(self))
+
+    def __iter__(self) -> Iterator[list[T]]:
+        width = self.width
+        for start in range(0, self.length, width):
+            row = self.data[start : start + width]
+            yield [chr(value) for value in row] if self._chars else row.tolist()
+
+    def __reduce__(self):
+        extra = (self.height, self.width)
+        return _attach, (SharedGrid, self.name, self.typecode, self.length, extra)
+
+
+def _attach(
+    kind: type[_SharedBuffer], name: str, typecode: str, length: int, extra: tuple
+) -> _SharedBuffer:
+    shared = _ATTACHED.get(name)
+    if shared is None:
+        shared = kind(_open_segment(name), typecode, length, False, *extra)
+        _ATTACHED[name] = shared
+    _ATTACHED.move_to_end(name)
+    return shared
+
+
+def _trim_attached() -> None:
+    # Runs between chunks, never while a chunk is still using an attachment.
+    while len(_ATTACHED) > _MAX_ATTACHED:
+        _ATTACHED.popitem(last=False)[1].close()
+    for segment in list(_UNCLOSED):
+        try:
+            segment.close()
+        except BufferError:
+            continue
+        _UNCLOSED.remove(segment)
+
+
+def _default_workers(workers: int | None) -> int:
+    return max(1, workers if workers is not None else os.cpu_count() or 1)
+
+
+def _chunks(items: list[T], workers: int, chunk_size: int | None) -> list[list[T]]:
+    size = chunk_size or max(1, math.ceil(len(items) / (workers * _CHUNKS_PER_WORKER)))
+    return [items[start : start + size] for start in range(0, len(items), size)]
+
+
+def _map_chunk(chunk: list[Any], function: Callable[..., R], args: tuple) -> list[R]:
+    try:
+        return [function(item, *args) for item in chunk]
+    finally:
+        _trim_attached()
+
+
+def _reduce_chunk(
+    chunk: list[Any],
+    function: Callable[..., R],
+    args: tuple,
+    combine: Callable[[R, R], R],
+    initial: R,
+) -> R:
+    try:
+        return functools.reduce(combine, (function(item, *args) for item in chunk), initial)
+    finally:
+        _trim_attached()
+
+
+def _run_chunks(
+    task: Callable[..., Any],
+    chunks: list[list[Any]],
+    extra: tuple,
+    workers: int,
+    executor: Any,
+) -> list[Any]:
+    if executor is None and (workers == 1 or len(chunks) <= 1):
+        return [task(chunk, *extra) for chunk in chunks]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    pool = executor or ProcessPoolExecutor(workers)
+    futures = [pool.submit(task, chunk, *extra) for chunk in chunks]
+    try:
+        return [future.result() for future in futures]
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
+    finally:
+        if executor is None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def parallel_map(
+    function: Callable[..., R],
+    items: Iterable[T],
+    *args: Any,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    executor: Any = None,
+) -> list[R]:
+    # function(item, *args) for every item, in input order. `function` must be importable at
+    # module level; pass SharedGrid/SharedArray objects through `args` so only their segment
+    # name is pickled. workers=1 runs in-process, which keeps tracebacks and profilers simple.
+    # A caller-supplied executor is reused and left running.
+    workers = _default_workers(workers)
+    chunks = _chunks(list(items), workers, chunk_size)
+    results = _run_chunks(_map_chunk, chunks, (function, args), workers, executor)
+    return [value for chunk in results for value in chunk]
+
+
+def parallel_reduce(
+    function: Callable[..., R],
+    items: Iterable[T],
+    *args: Any,
+    combine: Callable[[R, R], R],
+    initial: R,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    executor: Any = None,
+) -> R:
+    # Like parallel_map, but each chunk is folded in its worker so only one value per chunk
+    # crosses back. `initial` seeds every chunk, so it must be an identity for `combine`
+    # (0 for add, 1 for multiply, an empty set for union).
+    workers = _default_workers(workers)
+    chunks = _chunks(list(items), workers, chunk_size)
+    extra = (function, args, combine, initial)
+    results = _run_chunks(_reduce_chunk, chunks, extra, workers, executor)
+    return functools.reduce(combine, results, initial)
+
+
+__all__ = ["SharedArray", "SharedGrid", "parallel_map", "parallel_reduce"]
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Callable
+
+# Messages are dropped unless a supervisor installed a sink, and are rate limited so a
+# progress call inside a hot loop stays cheap.
+_MIN_INTERVAL = 0.05
+
+_sink: Callable[[str], None] | None = None
+_last_sent = 0.0
+
+
+def set_progress_sink(sink: Callable[[str], None] | None) -> None:
+    global _sink, _last_sent
+    _sink = sink
+    _last_sent = 0.0
+
+
+def report_progress(message: str, force: bool = False) -> None:
+    global _last_sent
+    if _sink is None:
+        return
+    now = perf_counter()
+    if force or now - _last_sent >= _MIN_INTERVAL:
+        _last_sent = now
+        _sink(message)
+
+
+__all__ = ["report_progress", "set_progress_sink"]
@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import heapq
+from array import array
+from collections import deque
+from typing import Any, Callable, Generic, Iterable, Iterator, TypeVar
+
+from models import Grid, Point
+
+T = TypeVar("T")
+
+UNREACHED = -1
+
+# Clockwise from up, so turning right is (direction + 1) % 4.
+DIRECTIONS: tuple[Point, ...] = (Point(-1, 0), Point(0, 1), Point(1, 0), Point(0, -1))
+
+Goal = Callable[[int], bool]
+Neighbors = Callable[[int], Iterable[int]]
+WeightedNeighbors = Callable[[int], Iterable[tuple[int, int]]]
+
+
+class StateCodec:
+    def __init__(self, cells: int, directions: int = 1, extra: int = 1) -> None:
+        self.cells = cells
+        self.directions = directions
+        self.extra = extra
+        self.size = cells * directions * extra
+
+    def pack(self, index: int, direction: int = 0, extra: int = 0) -> int:
+        return (index * self.directions + direction) * self.extra + extra
+
+    def unpack(self, state: int) -> tuple[int, int, int]:
+        rest, extra = divmod(state, self.extra)
+        index, direction = divmod(rest, self.directions)
+        return index, direction, extra
+
+
+class GridGraph(Generic[T]):
+    def __init__(self, grid: Grid[T], passable: Callable[[T], bool] | None = None) -> None:
+        self.width = grid.width
+        self.height = grid.height
+        self.size = self.width * self.height
+        self.open = bytearray(
+            1 if passable is None or passable(value) else 0 for row in grid for value in row
+        )
+
+    def index(self, point: Point) -> int:
+        return point.x * self.width + point.y
+
+    def point(self, index: int) -> Point:
+        return Point(*divmod(index, self.width))
+
+    def step(self, index: int, direction: int) -> int:
+        # Returns the neighbouring flat index in DIRECTIONS order, or UNREACHED at an edge or wall.
+        x, y = divmod(index, self.width)
+        offset = DIRECTIONS[direction]
+        nx, ny = x + offset.x, y + offset.y
+        if 0 <= nx < self.height and 0 <= ny < self.width:
+            target = nx * self.width + ny
+            if self.open[target]:
+                return target
+        return UNREACHED
+
+    def neighbors(self, index: int) -> list[int]:
+        width = self.width
+        is_open = self.open
+        y = index % width
+        result = []
+        if index >= width and is_open[index - width]:
+            result.append(index - width)
+        if y < width - 1 and is_open[index + 1]:
+            result.append(index + 1)
+        if index + width < self.size and is_open[index + width]:
+            result.append(index + width)
+        if y > 0 and is_open[index - 1]:
+            result.append(index - 1)
+        return result
+
+    def weighted_neighbors(self, index: int) -> list[tuple[int, int]]:
+        return [(neighbor, 1) for neighbor in self.neighbors(index)]
+
+    def manhattan_to(self, targets: Iterable[Point]) -> Callable[[int], int]:
+        goals = [(target.x, target.y) for target in targets]
+        width = self.width
+
+        def heuristic(index: int) -> int:
+            x, y = divmod(index, width)
+            return min(abs(x - gx) + abs(y - gy) for gx, gy in goals)
+
+        return heuristic
+
+
+class SearchResult:
+    def __init__(
+        self, distances: array, predecessors: list[list[int]] | None, goal: int | None
+    ) -> None:
+        self.distances = distances
+        self.predecessors = predecessors
+        self.goal = goal
+
+    def distance(self, state: int) -> int | None:
+        value = self.distances[state]
+        return None if value == UNREACHED else value
+
+    def reached(self) -> Iterator[int]:
+        return (state for state, value in enumerate(self.distances) if value != UNREACHED)
+
+    def path(self, state: int) -> list[int]:
+        if self.predecessors is None:
+            raise ValueError("Search was run without track_predecessors.")
+        if self.distances[state] == UNREACHED:
+            return []
+        # The first predecessor is the one that settled the state, so following it always
+        # moves to an earlier-settled state and ends at a start, which has none.
+        path = [state]
+        while self.predecessors[state]:
+            state = self.predecessors[state][0]
+            path.append(state)
+        path.reverse()
+        return path
+
+    def shortest_path_states(self, ends: Iterable[int]) -> set[int]:
+        # Every state that lies on at least one shortest path to any of the given ends.
+        if self.predecessors is None:
+            raise ValueError("Search was run without track_predecessors.")
+        stack = [end for end in ends if self.distances[end] != UNREACHED]
+        seen = set(stack)
+        while stack:
+            for previous in self.predecessors[stack.pop()]:
+                if previous not in seen:
+                    seen.add(previous)
+                    stack.append(previous)
+        return seen
+
+
+def _initialise(
+    size: int, starts: Iterable[int], track_predecessors: bool
+) -> tuple[array, list[list[int]] | None, list[int]]:
+    distances = array("q", [UNREACHED]) * size
+    predecessors: list[list[int]] | None = [[] for _ in range(size)] if track_predecessors else None
+    start_states = []
+    for start in starts:
+        if distances[start] == UNREACHED:
+            distances[start] = 0
+            start_states.append(start)
+    return distances, predecessors, start_states
+
+
+def bfs(
+    size: int,
+    starts: Iterable[int],
+    neighbors: Neighbors,
+    goal: Goal | None = None,
+    track_predecessors: bool = False,
+) -> SearchResult:
+    distances, predecessors, queue_states = _initialise(size, starts, track_predecessors)
+    queue = deque(queue_states)
+    while queue:
+        current = queue.popleft()
+        if goal is not None and goal(current):
+            return SearchResult(distances, predecessors, current)
+        next_distance = distances[current] + 1
+        for neighbor in neighbors(current):
+            known = distances[neighbor]
+            if known == UNREACHED:
+                distances[neighbor] = next_distance
+                queue.append(neighbor)
+                if predecessors is not None:
+                    predecessors[neighbor].append(current)
+            elif predecessors is not None and known == next_distance:
+                predecessors[neighbor].append(current)
+    return SearchResult(distances, predecessors, None)
+
+
+def bfs_01(
+    size: int,
+    starts: Iterable[int],
+    neighbors: WeightedNeighbors,
+    goal: Goal | None = None,
+    track_predecessors: bool = False,
+) -> SearchResult:
+    distances, predecessors, start_states = _initialise(size, starts, track_predecessors)
+    done = bytearray(size)
+    start_set = set(start_states)
+    queue = deque(start_states)
+    while queue:
+        current = queue.popleft()
+        if done[current]:
+            continue
+        done[current] = 1
+        if goal is not None and goal(current):
+            return SearchResult(distances, predecessors, current)
+        base = distances[current]
+        for neighbor, cost in neighbors(current):
+            # A settled neighbour can still tie (through zero-cost edges); the tie is appended
+            # after the settling predecessor, which stays first.
+            if neighbor in start_set:
+                continue
+            candidate = base + cost
+            known = distances[neighbor]
+            if known == UNREACHED or candidate < known:
+                distances[neighbor] = candidate
+                if predecessors is not None:
+                    predecessors[neighbor] = [current]
+                if cost:
+                    queue.append(neighbor)
+                else:
+                    queue.appendleft(neighbor)
+            elif predecessors is not None and candidate == known:
+                predecessors[neighbor].append(current)
+    return SearchResult(distances, predecessors, None)
+
+
+def dijkstra(
+    size: int,
+    starts: Iterable[int],
+    neighbors: WeightedNeighbors,
+    goal: Goal | None = None,
+    track_predecessors: bool = False,
+) -> SearchResult:
+    return astar(size, starts, neighbors, None, goal, track_predecessors)
+
+
+def astar(
+    size: int,
+    starts: Iterable[int],
+    neighbors: WeightedNeighbors,
+    heuristic: Callable[[int], int] | None,
+    goal: Goal | None = None,
+    track_predecessors: bool = False,
+) -> SearchResult:
+    # With heuristic=None this is plain Dijkstra. Heuristics must be consistent for the
+    # predecessor graph to contain every shortest path.
+    distances, predecessors, start_states = _initialise(size, starts, track_predecessors)
+    done = bytearray(size)
+    start_set = set(start_states)
+    estimate: Callable[[int], Any] = heuristic or (lambda state: 0)
+    heap = [(estimate(state), 0, state) for state in start_states]
+    heapq.heapify(heap)
+    while heap:
+        _, base, current = heapq.heappop(heap)
+        if done[current] or base != distances[current]:
+            continue
+        done[current] = 1
+        if goal is not None and goal(current):
+            return SearchResult(distances, predecessors, current)
+        for neighbor, cost in neighbors(current):
+            if neighbor in start_set:
+                continue
+            candidate = base + cost
+            known = distances[neighbor]
+            if done[neighbor]:
+                # Zero-cost edges and heuristic ties can settle an equal-cost neighbour first;
+                # it keeps its settling predecessor first and only gains the tie.
+                if predecessors is not None and candidate == known:
+                    predecessors[neighbor].append(current)
+                continue
+            if known == UNREACHED or candidate < known:
+                distances[neighbor] = candidate
+                if predecessors is not None:
+                    predecessors[neighbor] = [current]
+                heapq.heappush(heap, (candidate + estimate(neighbor), candidate, neighbor))
+            elif predecessors is not None and candidate == known:
+                predecessors[neighbor].append(current)
+    return SearchResult(distances, predecessors, None)
+
+
+__all__ = [
+    "DIRECTIONS",
+    "GridGraph",
+    "SearchResult",
+    "StateCodec",
+    "UNREACHED",
+    "astar",
+    "bfs",
+    "bfs_01",
+    "dijkstra",
+]
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, TypeVar
+
+S = TypeVar("S")
+
+Step = Callable[[S], S]
+
+
+@dataclass(frozen=True)
+class Cycle:
+    start: int
+    length: int
+
+    def equivalent_step(self, steps: int) -> int:
+        # The earliest step whose state matches the state after `steps` steps.
+        if steps < self.start:
+            return steps
+        return self.start + (steps - self.start) % self.length
+
+
+def _default_copy(state: S) -> Callable[[S], S]:
+    # States with a copy() (Grid, HashedGrid, list, dict, ...) may be mutated in place by
+    # the step function, so checkpoints need their own copy. Immutable states are shared.
+    copy = getattr(type(state), "copy", None)
+    return copy if copy is not None else (lambda value: value)
+
+
+def find_cycle(
+    initial: S,
+    step: Step[S],
+    copy: Callable[[S], S] | None = None,
+    limit: int | None = None,
+) -> Cycle | None:
+    # Brent's algorithm: only two live states and O(start + length) steps, with equality
+    # checked by ==. Grid compares cells and HashedGrid its incremental hash first. Returns
+    # None if no repeat shows up within `limit` steps.
+    return _search(initial, step, copy or _default_copy(initial), limit)[0]
+
+
+def _search(
+    initial: S, step: Step[S], copy: Callable[[S], S], limit: int | None
+) -> tuple[Cycle | None, S, int]:
+    # Also returns the last state simulated and its step number, so fast_forward can carry
+    # on from there instead of replaying everything from the initial state.
+    power = length = 1
+    tortoise = copy(initial)
+    hare = step(copy(initial))
+    steps = 1
+    while tortoise != hare:
+        if limit is not None and steps >= limit:
+            return None, hare, steps
+        if power == length:
+            tortoise = copy(hare)
+            power *= 2
+            length = 0
+        hare = step(hare)
+        length += 1
+        steps += 1
+
+    tortoise = copy(initial)
+    hare = copy(initial)
+    for _ in range(length):
+        hare = step(hare)
+    start = 0
+    while tortoise != hare:
+        tortoise = step(tortoise)
+        hare = step(hare)
+        start += 1
+    return Cycle(start, length), tortoise, start
+
+
+def run(initial: S, step: Step[S], steps: int, copy: Callable[[S], S] | None = None) -> S:
+    copy = copy or _default_copy(initial)
+    state = copy(initial)
+    for _ in range(steps):
+        state = step(state)
+    return state
+
+
+def fast_forward(
+    initial: S,
+    step: Step[S],
+    steps: int,
+    copy: Callable[[S], S] | None = None,
+    limit: int | None = None,
+) -> S:
+    # The state after `steps` steps, simulating only up to the cycle plus one lap of it.
+    # Without a cycle inside `limit` steps this falls back to simulating every step.
+    copy = copy or _default_copy(initial)
+    if steps <= 0:
+        return copy(initial)
+    bound = min(steps, limit) if limit is not None else steps
+    cycle, state, reached = _search(initial, step, copy, bound)
+    target = cycle.equivalent_step(steps) if cycle is not None else steps
+    if target < reached:
+        return run(initial, step, target, copy)
+    return run(state, step, target - reached, copy)
+
+
+__all__ = ["Cycle", "fast_forward", "find_cycle", "run"]
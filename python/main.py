@@ -1,24 +1,19 @@
 from __future__ import annotations
 
+import argparse
 import json
+import sys
 from pathlib import Path
+from time import perf_counter
 
-from models import SOLUTION_CONFIG_KEY, SolutionOptions
-from services import FileLoader, SolutionRunner
-from solutions import ISolution
-from solutions.day01.day01 import Day01
-from solutions.day02.day02 import Day02
-from solutions.day03.day03 import Day03
-from solutions.day04.day04 import Day04
-from solutions.day05.day05 import Day05
-from solutions.day06.day06 import Day06
-from solutions.day07.day07 import Day07
-from solutions.day08.day08 import Day08
-from solutions.day09.day09 import Day09
-from solutions.day10.day10 import Day10
-from solutions.day11.day11 import Day11
-from solutions.day12.day12 import Day12
-from solutions.day100.example import Example
+from models import SOLUTION_CONFIG_KEY, SolutionOptions, SolutionType
+from services import CachingFileLoader, FileLoader, IFileLoader, SolutionRunner
+from solutions import SolutionRegistry
+
+# Mode modules (daemon, answer store, benchmark, profiler, scaling, corpus) are imported in
+# the branch that uses them, so a plain single-day run starts without asyncio, sqlite3,
+# cProfile or tracemalloc. Their default paths are resolved there too.
+_PROFILER_KINDS = ("none", "cprofile", "sampling", "both")
 
 
 def strip_json_comments(content: str) -> str:
@@ -75,30 +70,223 @@ def load_solution_options() -> SolutionOptions:
     return SolutionOptions.from_dict(section)
 
 
-def build_solutions(file_loader: FileLoader, options: SolutionOptions) -> list[ISolution]:
-    return [
-        Day01(file_loader, options),
-        Day02(file_loader, options),
-        Day03(file_loader, options),
-        Day04(file_loader, options),
-        Day05(file_loader, options),
-        Day06(file_loader, options),
-        Day07(file_loader, options),
-        Day08(file_loader, options),
-        Day09(file_loader, options),
-        Day10(file_loader, options),
-        Day11(file_loader, options),
-        Day12(file_loader, options),
-        Example(file_loader, options),
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run Advent of Code solutions.")
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Run both parts of every day (with --corpus: both parts of each input).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for --all/--corpus/--serve (0 = one per CPU, 1 = in-process; "
+        "--serve always uses at least one worker process).",
+    )
+    parser.add_argument(
+        "--no-store",
+        action="store_true",
+        help="With --all, solve every day instead of reusing answers from the answer store.",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="With --all, recompute every answer and overwrite the answer store entries.",
+    )
+    parser.add_argument(
+        "--store",
+        type=Path,
+        help="SQLite answer store used by --all (default: .cache/answers.sqlite3).",
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Time the configured day/part (or every day with --all) instead of printing once.",
+    )
+    parser.add_argument("--iterations", type=int, default=10, help="Measured runs per benchmark.")
+    parser.add_argument("--warmup", type=int, default=2, help="Unmeasured runs before timing.")
+    parser.add_argument("--output", type=Path, help="Write benchmark results to this JSON file.")
+    parser.add_argument("--baseline", type=Path, help="Compare benchmark results to this JSON file.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Relative median slowdown versus --baseline that counts as a regression.",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="cprofile",
+        choices=_PROFILER_KINDS,
+        help="Report config/input/solve spans and profile solve() (default: cprofile).",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        type=Path,
+        help="Directory for .pstats and collapsed-stack files (default: .cache/profiles).",
+    )
+    parser.add_argument(
+        "--scaling",
+        action="store_true",
+        help="Time the configured day/part (or every day with --all) on generated inputs of "
+        "growing size and fit the complexity exponent.",
+    )
+    parser.add_argument(
+        "--sizes",
+        help="Comma-separated input sizes for --scaling (default: 1000,4000,16000,64000).",
+    )
+    parser.add_argument("--repeats", type=int, default=3, help="Timed solves per --scaling size.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for generated inputs.")
+    parser.add_argument(
+        "--max-exponent",
+        type=float,
+        default=1.3,
+        help="Fitted exponent above which --scaling reports a superlinear regression.",
+    )
+    parser.add_argument(
+        "--corpus",
+        metavar="SOURCE",
+        help="Run the configured day against every input in a directory or glob pattern.",
+    )
+    parser.add_argument(
+        "--corpus-output",
+        type=Path,
+        help="JSON Lines file for corpus results (default: .cache/corpus/dayNN.jsonl).",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip corpus inputs already recorded in --corpus-output and append to it.",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Start a warm solver daemon that answers JSON Lines requests over a socket.",
+    )
+    parser.add_argument(
+        "--remote",
+        action="store_true",
+        help="Ask a running daemon for the configured day/part instead of solving locally.",
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        help="Unix socket used by --serve/--remote (default: .cache/solver.sock).",
+    )
+    parser.add_argument(
+        "--port", type=int, help="Use localhost TCP on this port instead of the Unix socket."
+    )
+    parser.add_argument(
+        "--input", type=Path, help="With --remote, send this file as the puzzle input inline."
+    )
+    return parser.parse_args(argv)
+
+
+def run_remote(options: SolutionOptions, arguments: argparse.Namespace) -> int:
+    from services.daemon import DEFAULT_SOCKET_PATH, send_request
+
+    request: dict[str, object] = {
+        "day": options.day,
+        "part": 1 if options.solution_type == SolutionType.FIRST else 2,
+        "runType": options.run_type.value,
+    }
+    if arguments.input:
+        request["input"] = arguments.input.read_text(encoding="utf-8")
+    response = send_request(request, arguments.socket or DEFAULT_SOCKET_PATH, arguments.port)
+    if not response.get("ok"):
+        print(f"Error: {response.get('error')}")
+        return 1
+    print(
+        f"Day: {response['day']}, Solution {response['part']}: {response['answer']} "
+        f"({response['seconds'] * 1e3:.2f} ms solve, {response['elapsed'] * 1e3:.2f} ms total)"
+    )
+    return 0
+
+
+def run_benchmark(runner: SolutionRunner, arguments: argparse.Namespace) -> int:
+    from services.benchmark import Benchmark, find_regressions, load_report, write_report
+
+    benchmark = Benchmark(arguments.iterations, arguments.warmup)
+    results = runner.benchmark(benchmark, arguments.all)
+    if arguments.output:
+        write_report(results, arguments.output)
+    if not arguments.baseline:
+        return 0
+
+    regressions = find_regressions(results, load_report(arguments.baseline), arguments.threshold)
+    for regression in regressions:
+        print(
+            f"Regression: {regression.key} median {regression.baseline_seconds * 1e3:.2f} ms -> "
+            f"{regression.current_seconds * 1e3:.2f} ms ({regression.ratio:.2f}x)"
+        )
+    return 1 if regressions else 0
+
+
+def run_scaling(runner: SolutionRunner, arguments: argparse.Namespace) -> int:
+    from services.scaling import DEFAULT_SIZES, ScalingBenchmark
+
+    sizes = DEFAULT_SIZES
+    if arguments.sizes:
+        sizes = tuple(int(size) for size in arguments.sizes.split(",") if size.strip())
+    benchmark = ScalingBenchmark(sizes, arguments.repeats, arguments.seed)
+    results = runner.scaling(benchmark, arguments.max_exponent, arguments.all)
+    superlinear = [
+        result
+        for result in results
+        if result.exponent is not None and result.exponent > arguments.max_exponent
     ]
+    return 1 if superlinear else 0
 
 
 def main() -> None:
+    arguments = parse_arguments()
+    started = perf_counter()
     options = load_solution_options()
-    file_loader = FileLoader()
-    solutions = build_solutions(file_loader, options)
-    runner = SolutionRunner(solutions, options)
-    runner.run()
+    config_seconds = perf_counter() - started
+    file_loader: IFileLoader = FileLoader()
+    if options.use_input_cache:
+        file_loader = CachingFileLoader(file_loader)
+    runner = SolutionRunner(SolutionRegistry(), file_loader, options)
+    if arguments.serve:
+        import asyncio
+
+        from services.daemon import DEFAULT_SOCKET_PATH, SolverDaemon
+
+        daemon = SolverDaemon(SolutionRegistry(), options, arguments.workers)
+        asyncio.run(daemon.serve(arguments.socket or DEFAULT_SOCKET_PATH, arguments.port))
+        return
+    if arguments.remote:
+        sys.exit(run_remote(options, arguments))
+    if arguments.corpus:
+        from services.corpus import DEFAULT_CORPUS_DIR
+
+        output = arguments.corpus_output or DEFAULT_CORPUS_DIR / f"day{options.day:02d}.jsonl"
+        runner.run_corpus(
+            arguments.corpus, output, arguments.workers, arguments.resume, arguments.all
+        )
+        return
+    if arguments.profile:
+        from services.profiler import DEFAULT_PROFILE_DIR, ProfilerKind, SolveProfiler
+
+        kind = ProfilerKind(arguments.profile)
+        profiler = SolveProfiler(kind, arguments.profile_dir or DEFAULT_PROFILE_DIR)
+        runner.profile(profiler, config_seconds, arguments.all)
+        return
+    if arguments.scaling:
+        sys.exit(run_scaling(runner, arguments))
+    if arguments.benchmark:
+        sys.exit(run_benchmark(runner, arguments))
+    if arguments.all:
+        if arguments.no_store:
+            runner.run_all(arguments.workers)
+            return
+        from services.answer_store import DEFAULT_STORE_PATH, AnswerStore
+
+        with AnswerStore(arguments.store or DEFAULT_STORE_PATH) as store:
+            runner.run_all(arguments.workers, store, arguments.refresh)
+    else:
+        runner.run()
 
 
 if __name__ == "__main__":
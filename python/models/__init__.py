@@ -1,12 +1,43 @@
+from .bit_grid import BitGrid
+from .compact_grid import CompactGrid
 from .grid import Grid, Point
-from .solution_models import RunType, SolutionOptions, SolutionType, SOLUTION_CONFIG_KEY
+from . import grid_ops
+from .hashed_grid import HashedGrid
+from .interval_set import IntervalSet, parse_range
+from .point_collections import PointMap, PointSet
+from .regions import RegionMap, label_regions
+from .spatial import KDTree, PointN, closest_pairs, parse_point
+from .sparse_grid import SparseGrid
+from .solution_models import (
+    RunType,
+    SolutionOptions,
+    SolutionType,
+    SolveBudget,
+    SOLUTION_CONFIG_KEY,
+)
 
 __all__ = [
+    "BitGrid",
+    "CompactGrid",
     "Grid",
+    "HashedGrid",
+    "IntervalSet",
+    "KDTree",
     "Point",
+    "PointMap",
+    "PointN",
+    "PointSet",
+    "RegionMap",
     "RunType",
     "SolutionOptions",
     "SolutionType",
+    "SolveBudget",
     "SOLUTION_CONFIG_KEY",
+    "SparseGrid",
+    "closest_pairs",
+    "grid_ops",
+    "label_regions",
+    "parse_point",
+    "parse_range",
 ]
 
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Collection, Iterable, Iterator, Sequence, TypeVar
+
+from .grid import Grid, Point
+
+T = TypeVar("T")
+
+_ORTHOGONAL = ((-1, 0), (1, 0), (0, -1), (0, 1))
+_DIAGONAL = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+class BitGrid:
+    # The whole grid is one int. Row x occupies bits [x * stride, x * stride + width) and the
+    # extra guard column per row stays zero, so a one-column shift never wraps into the next row.
+    def __init__(self, height: int, width: int, bits: int = 0) -> None:
+        if height <= 0 or width <= 0:
+            raise ValueError("Grid must have at least one row and column.")
+        self._height = height
+        self._width = width
+        self._stride = width + 1
+        self._row_starts = ((1 << (self._stride * height)) - 1) // ((1 << self._stride) - 1)
+        self._full = self._row_starts * ((1 << width) - 1)
+        self.bits = bits & self._full
+
+    @staticmethod
+    def from_grid(rows: Iterable[Sequence[T]], predicate: Callable[[T], bool]) -> "BitGrid":
+        # Built as one binary string (most significant bit first) because int(text, 2) is linear.
+        chunks = []
+        width = 0
+        for row in rows:
+            width = len(row)
+            chunks.append("0" + "".join("1" if predicate(value) else "0" for value in reversed(row)))
+        if not chunks:
+            raise ValueError("Grid must have at least one row and column.")
+        if any(len(chunk) != width + 1 for chunk in chunks):
+            raise ValueError("BitGrid requires every row to have the same length.")
+        chunks.reverse()
+        return BitGrid(len(chunks), width, int("".join(chunks), 2))
+
+    @staticmethod
+    def from_points(height: int, width: int, points: Iterable[Point]) -> "BitGrid":
+        grid = BitGrid(height, width)
+        for point in points:
+            grid.set(point, True)
+        return grid
+
+    def to_grid(self, true_value: Any = True, false_value: Any = False) -> Grid[Any]:
+        return Grid(
+            [[true_value if bit == "1" else false_value for bit in row] for row in self._row_texts()]
+        )
+
+    def to_strings(self, on: str = "#", off: str = ".") -> list[str]:
+        return [row.replace("1", on).replace("0", off) for row in self._row_texts()]
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    def empty(self) -> "BitGrid":
+        return BitGrid(self._height, self._width)
+
+    def full(self) -> "BitGrid":
+        return BitGrid(self._height, self._width, self._full)
+
+    def copy(self) -> "BitGrid":
+        return BitGrid(self._height, self._width, self.bits)
+
+    def out_of_bounds(self, point: Point) -> bool:
+        return not (0 <= point.x < self._height and 0 <= point.y < self._width)
+
+    def get(self, point: Point) -> bool:
+        if self.out_of_bounds(point):
+            return False
+        return bool(self.bits >> (point.x * self._stride + point.y) & 1)
+
+    def set(self, point: Point, value: bool) -> None:
+        if self.out_of_bounds(point):
+            raise IndexError("Point is outside of the grid.")
+        bit = 1 << (point.x * self._stride + point.y)
+        self.bits = self.bits | bit if value else self.bits & ~bit
+
+    def count(self) -> int:
+        return self.bits.bit_count()
+
+    def points(self) -> Iterator[Point]:
+        # Walks the binary text with str.find, so the cost is linear in the grid size rather
+        # than one big-int operation per set bit.
+        text = bin(self.bits)[:1:-1]
+        stride = self._stride
+        index = text.find("1")
+        while index != -1:
+            yield Point(*divmod(index, stride))
+            index = text.find("1", index + 1)
+
+    def find_items(self, target: bool = True) -> list[Point]:
+        return list((self if target else ~self).points())
+
+    def shift(self, dx: int, dy: int) -> "BitGrid":
+        # Moves every cell by (dx, dy); cells pushed off an edge are dropped.
+        offset = dx * self._stride + dy
+        bits = self.bits << offset if offset >= 0 else self.bits >> -offset
+        if abs(dy) > 1:
+            bits &= self._column_mask(max(0, dy), min(self._width, self._width + dy))
+        return BitGrid(self._height, self._width, bits)
+
+    def dilate(self, diagonal: bool = False) -> "BitGrid":
+        return self | self.neighbors(diagonal)
+
+    def neighbors(self, diagonal: bool = False) -> "BitGrid":
+        # Every cell with at least one set neighbour.
+        bits = 0
+        for plane in self._neighbor_planes(diagonal):
+            bits |= plane
+        return BitGrid(self._height, self._width, bits)
+
+    def neighbor_count_planes(self, diagonal: bool = True) -> list[int]:
+        # Bit-sliced counters: bit k of every cell's neighbour count lives in planes[k]. Each
+        # shifted plane is added with a ripple of half adders across all cells at once.
+        planes = [0, 0, 0, 0]
+        for carry in self._neighbor_planes(diagonal):
+            for level in range(4):
+                if not carry:
+                    break
+                current = planes[level]
+                planes[level] = current ^ carry
+                carry &= current
+        return planes
+
+    def count_in(self, planes: Sequence[int], counts: Collection[int]) -> "BitGrid":
+        # Cells whose bit-sliced neighbour count is one of the given values.
+        full = self._full
+        bits = 0
+        for count in counts:
+            matches = full
+            for level, plane in enumerate(planes):
+                matches &= plane if count >> level & 1 else ~plane
+            bits |= matches
+        return BitGrid(self._height, self._width, bits & full)
+
+    def step(
+        self,
+        birth: Collection[int] = (3,),
+        survive: Collection[int] = (2, 3),
+        diagonal: bool = True,
+    ) -> "BitGrid":
+        planes = self.neighbor_count_planes(diagonal)
+        born = self.count_in(planes, birth).bits & ~self.bits
+        kept = self.count_in(planes, survive).bits & self.bits
+        return BitGrid(self._height, self._width, born | kept)
+
+    def run(
+        self,
+        steps: int,
+        birth: Collection[int] = (3,),
+        survive: Collection[int] = (2, 3),
+        diagonal: bool = True,
+    ) -> "BitGrid":
+        current = self
+        for _ in range(steps):
+            current = current.step(birth, survive, diagonal)
+        return current
+
+    def flood(self, start: "BitGrid | Point", diagonal: bool = False) -> "BitGrid":
+        # Cells of this grid reachable from start, found by dilating the whole frontier at once.
+        reached = self._as_seed(start).bits & self.bits
+        while True:
+            grown = self._dilate_bits(reached, diagonal) & self.bits
+            if grown == reached:
+                return BitGrid(self._height, self._width, reached)
+            reached = grown
+
+    def flood_layers(self, start: "BitGrid | Point", diagonal: bool = False) -> Iterator["BitGrid"]:
+        # Yields the BFS frontier at distance 0, 1, 2, ... until nothing new is reachable.
+        reached = frontier = self._as_seed(start).bits & self.bits
+        while frontier:
+            yield BitGrid(self._height, self._width, frontier)
+            grown = self._dilate_bits(frontier, diagonal) & self.bits
+            frontier = grown & ~reached
+            reached |= frontier
+
+    def __and__(self, other: "BitGrid") -> "BitGrid":
+        return BitGrid(self._height, self._width, self.bits & self._check(other).bits)
+
+    def __or__(self, other: "BitGrid") -> "BitGrid":
+        return BitGrid(self._height, self._width, self.bits | self._check(other).bits)
+
+    def __xor__(self, other: "BitGrid") -> "BitGrid":
+        return BitGrid(self._height, self._width, self.bits ^ self._check(other).bits)
+
+    def __sub__(self, other: "BitGrid") -> "BitGrid":
+        return BitGrid(self._height, self._width, self.bits & ~self._check(other).bits)
+
+    def __invert__(self) -> "BitGrid":
+        return BitGrid(self._height, self._width, ~self.bits)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BitGrid):
+            return NotImplemented
+        return (self._height, self._width, self.bits) == (other._height, other._width, other.bits)
+
+    def __hash__(self) -> int:
+        return hash((self._height, self._width, self.bits))
+
+    def __bool__(self) -> bool:
+        return bool(self.bits)
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __iter__(self) -> Iterator[list[bool]]:
+        for row in self._row_texts():
+            yield [bit == "1" for bit in row]
+
+    def _row_texts(self) -> Iterator[str]:
+        text = bin(self.bits)[:1:-1].ljust(self._stride * self._height, "0")
+        for x in range(self._height):
+            start = x * self._stride
+            yield text[start : start + self._width]
+
+    def _neighbor_planes(self, diagonal: bool) -> Iterator[int]:
+        offsets = _ORTHOGONAL + _DIAGONAL if diagonal else _ORTHOGONAL
+        stride = self._stride
+        bits = self.bits
+        full = self._full
+        for dx, dy in offsets:
+            offset = dx * stride + dy
+            yield (bits << offset if offset >= 0 else bits >> -offset) & full
+
+    def _dilate_bits(self, bits: int, diagonal: bool) -> int:
+        stride = self._stride
+        grown = bits | bits << 1 | bits >> 1
+        grown_rows = grown if diagonal else bits
+        grown |= grown_rows << stride | grown_rows >> stride
+        return grown & self._full
+
+    def _column_mask(self, start: int, stop: int) -> int:
+        if start >= stop:
+            return 0
+        return self._row_starts * (((1 << (stop - start)) - 1) << start)
+
+    def _as_seed(self, start: "BitGrid | Point") -> "BitGrid":
+        if isinstance(start, Point):
+            return BitGrid.from_points(self._height, self._width, (start,))
+        return self._check(start)
+
+    def _check(self, other: "BitGrid") -> "BitGrid":
+        if (other._height, other._width) != (self._height, self._width):
+            raise ValueError("BitGrid dimensions do not match.")
+        return other
+
+
+__all__ = ["BitGrid"]
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from typing import Any, Generic, Iterable, Iterator, MutableSequence, Sequence, Tuple, TypeVar
+
+from .grid import Grid, Point
+from .regions import RegionMap, label_regions, region_perimeter
+
+T = TypeVar("T")
+
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+_LATIN1: Tuple[str, ...] = tuple(chr(code) for code in range(256))
+
+_TOP = 1
+_BOTTOM = 2
+_LEFT = 4
+_RIGHT = 8
+
+
+def _encode_cells(cells: list) -> tuple[MutableSequence, Tuple[str, ...] | None]:
+    if all(type(value) is int for value in cells):
+        if all(_INT64_MIN <= value <= _INT64_MAX for value in cells):
+            return array("q", cells), None
+    elif all(type(value) is str and len(value) == 1 and ord(value) < 256 for value in cells):
+        return bytearray(ord(value) for value in cells), _LATIN1
+    return cells, None
+
+
+def _build_offset_table(width: int) -> Tuple[Tuple[int, ...], ...]:
+    # Indexed by edge flags; entries follow the Grid cardinal order (up, down, left, right).
+    table = []
+    for flags in range(16):
+        offsets = []
+        if not flags & _TOP:
+            offsets.append(-width)
+        if not flags & _BOTTOM:
+            offsets.append(width)
+        if not flags & _LEFT:
+            offsets.append(-1)
+        if not flags & _RIGHT:
+            offsets.append(1)
+        table.append(tuple(offsets))
+    return tuple(table)
+
+
+def _build_edge_flags(width: int, height: int) -> bytearray:
+    flags = bytearray(width * height)
+    for x in range(height):
+        row_flags = (_TOP if x == 0 else 0) | (_BOTTOM if x == height - 1 else 0)
+        start = x * width
+        for y in range(width):
+            flags[start + y] = (
+                row_flags | (_LEFT if y == 0 else 0) | (_RIGHT if y == width - 1 else 0)
+            )
+    return flags
+
+
+class CompactGrid(Generic[T]):
+    def __init__(self, data: Sequence[Sequence[T]]) -> None:
+        if not data or not data[0]:
+            raise ValueError("Grid must have at least one row and column.")
+        width = len(data[0])
+        if any(len(row) != width for row in data):
+            raise ValueError("CompactGrid requires every row to have the same length.")
+
+        cells = [value for row in data for value in row]
+        self._width = width
+        self._height = len(data)
+        self._cells, self._decode = _encode_cells(cells)
+        self._edges = _build_edge_flags(self._width, self._height)
+        self._offsets = _build_offset_table(self._width)
+
+    @staticmethod
+    def from_grid(grid: Grid[T]) -> "CompactGrid[T]":
+        return CompactGrid(list(grid))
+
+    def to_grid(self) -> Grid[T]:
+        return Grid(list(self))
+
+    def as_array(self) -> Any:
+        from .grid_ops import require_numpy
+
+        numpy = require_numpy()
+        if self._decode is not None:
+            codes = numpy.frombuffer(self._cells, dtype=numpy.uint8)
+            return numpy.array(self._decode)[codes].reshape(self._height, self._width)
+        return numpy.array(self._cells).reshape(self._height, self._width)
+
+    @staticmethod
+    def from_array(values: Any) -> "CompactGrid[Any]":
+        return CompactGrid(values.tolist())
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    def index_of(self, point: Point) -> int:
+        return point.x * self._width + point.y
+
+    def point_of(self, index: int) -> Point:
+        x, y = divmod(index, self._width)
+        return Point(x, y)
+
+    def get_at(self, index: int) -> T:
+        if self._decode is None:
+            return self._cells[index]
+        return self._decode[self._cells[index]]  # type: ignore[return-value]
+
+    def set_at(self, index: int, value: T) -> None:
+        cells = self._cells
+        try:
+            if self._decode is not None:
+                cells[index] = ord(value)  # type: ignore[arg-type]
+            elif type(cells) is list or type(value) is int:
+                cells[index] = value
+            else:
+                raise TypeError("Value does not fit the typed buffer.")
+        except (TypeError, OverflowError, ValueError):
+            self._widen()
+            self._cells[index] = value
+
+    def neighbor_indices(self, index: int) -> list[int]:
+        return [index + offset for offset in self._offsets[self._edges[index]]]
+
+    def get(self, point: Point) -> T | None:
+        if self.out_of_bounds(point):
+            return None
+        return self.get_at(point.x * self._width + point.y)
+
+    def set(self, point: Point, value: T) -> None:
+        if self.out_of_bounds(point):
+            raise IndexError("Point is outside grid bounds.")
+        self.set_at(point.x * self._width + point.y, value)
+
+    def copy(self) -> "CompactGrid[T]":
+        clone = CompactGrid.__new__(CompactGrid)
+        clone._width = self._width
+        clone._height = self._height
+        clone._cells = self._cells[:]
+        clone._decode = self._decode
+        clone._edges = self._edges
+        clone._offsets = self._offsets
+        return clone
+
+    def get_unique_items(self) -> list[T]:
+        unique = dict.fromkeys(self._cells)
+        if self._decode is None:
+            return list(unique)
+        return [self._decode[code] for code in unique]  # type: ignore[misc]
+
+    def find_items(self, target: T) -> list[Point]:
+        needle = self._encode_value(target)
+        if needle is None:
+            return []
+        width = self._width
+        cells = self._cells
+        return [Point(*divmod(index, width)) for index, value in enumerate(cells) if value == needle]
+
+    def find_connected_region(self, start: Point) -> list[Point]:
+        if self.out_of_bounds(start):
+            raise ValueError("Start point must be within the grid.")
+
+        width = self._width
+        cells = self._cells
+        edges = self._edges
+        offsets = self._offsets
+        start_index = start.x * width + start.y
+        start_value = cells[start_index]
+
+        visited = bytearray(len(cells))
+        visited[start_index] = 1
+        queue = deque((start_index,))
+        region: list[Point] = []
+
+        while queue:
+            current = queue.popleft()
+            region.append(Point(*divmod(current, width)))
+            for offset in offsets[edges[current]]:
+                neighbor = current + offset
+                if not visited[neighbor] and cells[neighbor] == start_value:
+                    visited[neighbor] = 1
+                    queue.append(neighbor)
+
+        return region
+
+    def label_regions(self) -> RegionMap:
+        # Labelling runs on the encoded bytes; only the per-region values are decoded.
+        region_map = label_regions(self._width, self._height, self._cells)
+        if self._decode is not None:
+            decode = self._decode
+            region_map.values = [decode[code] for code in region_map.values]
+        return region_map
+
+    def calculate_region_perimeter(
+        self, points: Iterable[Point], label_map: RegionMap | None = None
+    ) -> list[Point]:
+        if label_map is not None:
+            return region_perimeter(points, label_map)
+
+        width = self._width
+        inside = bytearray(len(self._cells))
+        indices: list[int] = []
+        for point in points:
+            if self.out_of_bounds(point):
+                continue
+            index = point.x * width + point.y
+            if not inside[index]:
+                inside[index] = 1
+                indices.append(index)
+
+        perimeter: list[Point] = []
+        for index in indices:
+            x, y = divmod(index, width)
+            flags = self._edges[index]
+            if flags & _TOP or not inside[index - width]:
+                perimeter.append(Point(x - 1, y))
+            if flags & _BOTTOM or not inside[index + width]:
+                perimeter.append(Point(x + 1, y))
+            if flags & _LEFT or not inside[index - 1]:
+                perimeter.append(Point(x, y - 1))
+            if flags & _RIGHT or not inside[index + 1]:
+                perimeter.append(Point(x, y + 1))
+
+        return perimeter
+
+    def swap_items(self, point_a: Point, point_b: Point) -> None:
+        if self.out_of_bounds(point_a) or self.out_of_bounds(point_b):
+            raise IndexError("Cannot swap items outside grid bounds.")
+
+        index_a = point_a.x * self._width + point_a.y
+        index_b = point_b.x * self._width + point_b.y
+        cells = self._cells
+        cells[index_a], cells[index_b] = cells[index_b], cells[index_a]
+
+    def get_adjacent_item(self, point: Point, offset: Point) -> tuple[Point, T | None]:
+        neighbor = Point(point.x + offset.x, point.y + offset.y)
+        return neighbor, self.get(neighbor)
+
+    def get_surrounding_items(self, point: Point) -> list[Point]:
+        if self.out_of_bounds(point):
+            candidates = (
+                Point(point.x - 1, point.y),
+                Point(point.x + 1, point.y),
+                Point(point.x, point.y - 1),
+                Point(point.x, point.y + 1),
+            )
+            return [candidate for candidate in candidates if not self.out_of_bounds(candidate)]
+
+        width = self._width
+        index = point.x * width + point.y
+        return [Point(*divmod(index + offset, width)) for offset in self._offsets[self._edges[index]]]
+
+    def out_of_bounds(self, point: Point) -> bool:
+        return not (0 <= point.x < self._height and 0 <= point.y < self._width)
+
+    def to_strings(self, mapper: callable | None = None) -> list[str]:
+        if mapper is None and self._decode is not None:
+            width = self._width
+            text = self._cells.decode("latin-1")  # type: ignore[union-attr]
+            return [text[start : start + width] for start in range(0, len(text), width)]
+        mapper = mapper or (lambda value: str(value))
+        return ["".join(mapper(value) for value in row) for row in self]
+
+    def __iter__(self) -> Iterator[list[T]]:
+        width = self._width
+        for start in range(0, len(self._cells), width):
+            row = self._cells[start : start + width]
+            if self._decode is None:
+                yield list(row)
+            else:
+                yield [self._decode[code] for code in row]  # type: ignore[misc]
+
+    def _encode_value(self, value: T) -> object | None:
+        if self._decode is None:
+            return value
+        if type(value) is str and len(value) == 1 and ord(value) < 256:
+            return ord(value)
+        return None
+
+    def _widen(self) -> None:
+        if self._decode is None:
+            self._cells = list(self._cells)
+        else:
+            self._cells = [self._decode[code] for code in self._cells]  # type: ignore[misc]
+            self._decode = None
+
+
+__all__ = ["CompactGrid"]
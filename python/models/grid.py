@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
-from typing import Generic, Iterable, Iterator, List, Sequence, Tuple, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, Iterable, Iterator, List, Sequence, Tuple, TypeVar
+
+if TYPE_CHECKING:
+    from .regions import RegionMap
 
 T = TypeVar("T")
 
@@ -26,6 +30,14 @@ class Grid(Generic[T]):
             raise ValueError("Grid must have at least one row and column.")
         self._data: List[List[T]] = [list(row) for row in data]
 
+    @property
+    def height(self) -> int:
+        return len(self._data)
+
+    @property
+    def width(self) -> int:
+        return len(self._data[0])
+
     def get(self, point: Point) -> T | None:
         if self.out_of_bounds(point):
             return None
@@ -39,6 +51,29 @@ class Grid(Generic[T]):
     def copy(self) -> "Grid[T]":
         return Grid(self._data)
 
+    def as_array(self) -> Any:
+        from .grid_ops import require_numpy
+
+        return require_numpy().array(self._data)
+
+    @staticmethod
+    def from_array(array: Any) -> "Grid[Any]":
+        return Grid(array.tolist())
+
+    def transpose(self) -> "Grid[T]":
+        return type(self)([list(column) for column in zip(*self._data)])
+
+    def rotate(self, turns: int = 1) -> "Grid[T]":
+        rows = self._data
+        for _ in range(turns % 4):
+            rows = [list(column) for column in zip(*reversed(rows))]
+        return type(self)(rows)
+
+    def flip(self, vertical: bool = False) -> "Grid[T]":
+        if vertical:
+            return type(self)(self._data[::-1])
+        return type(self)([row[::-1] for row in self._data])
+
     def get_unique_items(self) -> list[T]:
         seen = set()
         unique: list[T] = []
@@ -63,11 +98,11 @@ class Grid(Generic[T]):
             raise ValueError("Start point must be within the grid.")
 
         visited = {start}
-        queue: list[Point] = [start]
+        queue = deque((start,))
         region: list[Point] = []
 
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             region.append(current)
 
             for offset in _CARDINAL_OFFSETS:
@@ -82,7 +117,22 @@ class Grid(Generic[T]):
 
         return region
 
-    def calculate_region_perimeter(self, points: Iterable[Point]) -> list[Point]:
+    def label_regions(self) -> "RegionMap":
+        from .regions import label_regions
+
+        if any(len(row) != self.width for row in self._data):
+            raise ValueError("Region labelling requires every row to have the same length.")
+        cells = [value for row in self._data for value in row]
+        return label_regions(self.width, self.height, cells)
+
+    def calculate_region_perimeter(
+        self, points: Iterable[Point], label_map: "RegionMap | None" = None
+    ) -> list[Point]:
+        if label_map is not None:
+            from .regions import region_perimeter
+
+            return region_perimeter(points, label_map)
+
         point_set = {point for point in points}
         perimeter: list[Point] = []
 
@@ -130,3 +180,10 @@ class Grid(Generic[T]):
     def __iter__(self) -> Iterator[list[T]]:
         return iter(self._data)
 
+    def __eq__(self, other: object) -> bool:
+        # Compared by cells, so simulation states can be checked for repeats. Grids are
+        # mutable and stay unhashable; HashedGrid hashes its incremental digest instead.
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return self._data == other._data
+
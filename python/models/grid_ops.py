@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from importlib.util import find_spec
+from typing import Any, Collection, TypeVar
+
+from .grid import Grid, Point
+
+T = TypeVar("T")
+
+# NumPy is optional and only imported on first use, so days that never touch these
+# operations do not pay for it. Every operation below also has a pure-Python path.
+HAS_NUMPY = find_spec("numpy") is not None
+
+_ORTHOGONAL = ((-1, 0), (1, 0), (0, -1), (0, 1))
+_DIAGONAL = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+def require_numpy() -> Any:
+    if not HAS_NUMPY:
+        raise ImportError("NumPy is required for array-backed grid operations (pip install numpy).")
+    import numpy
+
+    return numpy
+
+
+def mask(grid: Grid[T], target: T) -> Grid[bool]:
+    if not HAS_NUMPY:
+        return Grid([[value == target for value in row] for row in grid])
+    return Grid.from_array(grid.as_array() == target)
+
+
+def find(grid: Grid[T], target: T) -> list[Point]:
+    if not HAS_NUMPY:
+        return grid.find_items(target)
+    matches = require_numpy().argwhere(grid.as_array() == target)
+    return [Point(int(x), int(y)) for x, y in matches]
+
+
+def count_neighbors(cells: Any, diagonal: bool = False) -> Any:
+    # Sums shifted views of a zero-padded boolean array instead of a per-cell loop.
+    numpy = require_numpy()
+    padded = numpy.pad(numpy.asarray(cells, dtype=numpy.uint8), 1)
+    height, width = padded.shape[0] - 2, padded.shape[1] - 2
+    offsets = _ORTHOGONAL + _DIAGONAL if diagonal else _ORTHOGONAL
+    counts = numpy.zeros((height, width), dtype=numpy.uint8)
+    for dx, dy in offsets:
+        counts += padded[1 + dx : 1 + dx + height, 1 + dy : 1 + dy + width]
+    return counts
+
+
+def neighbor_counts(grid: Grid[T], target: T, diagonal: bool = False) -> Grid[int]:
+    if not HAS_NUMPY:
+        return Grid(_count_neighbors_python(grid, target, diagonal))
+    return Grid.from_array(count_neighbors(grid.as_array() == target, diagonal))
+
+
+def step_automaton(
+    grid: Grid[T],
+    alive: T,
+    dead: T,
+    birth: Collection[int] = (3,),
+    survive: Collection[int] = (2, 3),
+    diagonal: bool = True,
+) -> Grid[T]:
+    return run_automaton(grid, 1, alive, dead, birth, survive, diagonal)
+
+
+def run_automaton(
+    grid: Grid[T],
+    steps: int,
+    alive: T,
+    dead: T,
+    birth: Collection[int] = (3,),
+    survive: Collection[int] = (2, 3),
+    diagonal: bool = True,
+) -> Grid[T]:
+    if not HAS_NUMPY:
+        current = grid
+        for _ in range(steps):
+            current = _step_python(current, alive, dead, birth, survive, diagonal)
+        return current
+
+    numpy = require_numpy()
+    cells = grid.as_array() == alive
+    birth_rule = numpy.zeros(9, dtype=bool)
+    survive_rule = numpy.zeros(9, dtype=bool)
+    birth_rule[list(birth)] = True
+    survive_rule[list(survive)] = True
+    for _ in range(steps):
+        counts = count_neighbors(cells, diagonal)
+        cells = numpy.where(cells, survive_rule[counts], birth_rule[counts])
+
+    values = numpy.empty(cells.shape, dtype=object)
+    values[cells] = alive
+    values[~cells] = dead
+    return Grid.from_array(values)
+
+
+def _count_neighbors_python(grid: Grid[T], target: T, diagonal: bool) -> list[list[int]]:
+    rows = [[value == target for value in row] for row in grid]
+    height, width = len(rows), len(rows[0])
+    offsets = _ORTHOGONAL + _DIAGONAL if diagonal else _ORTHOGONAL
+    counts = [[0] * width for _ in range(height)]
+    for x in range(height):
+        counts_row = counts[x]
+        for dx, dy in offsets:
+            source_x = x + dx
+            if not 0 <= source_x < height:
+                continue
+            source = rows[source_x]
+            for y in range(max(0, -dy), min(width, width - dy)):
+                if source[y + dy]:
+                    counts_row[y] += 1
+    return counts
+
+
+def _step_python(
+    grid: Grid[T],
+    alive: T,
+    dead: T,
+    birth: Collection[int],
+    survive: Collection[int],
+    diagonal: bool,
+) -> Grid[T]:
+    counts = _count_neighbors_python(grid, alive, diagonal)
+    return Grid(
+        [
+            [
+                alive if (count in survive if value == alive else count in birth) else dead
+                for value, count in zip(row, counts_row)
+            ]
+            for row, counts_row in zip(grid, counts)
+        ]
+    )
+
+
+__all__ = [
+    "HAS_NUMPY",
+    "count_neighbors",
+    "find",
+    "mask",
+    "neighbor_counts",
+    "require_numpy",
+    "run_automaton",
+    "step_automaton",
+]
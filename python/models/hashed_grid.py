@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from typing import Sequence, TypeVar
+
+from .grid import Grid, Point
+
+T = TypeVar("T")
+
+
+def _cell_key(x: int, y: int, value: object) -> int:
+    # Zobrist-style key for "value at (x, y)". Tuple hashing is already well mixed, so no
+    # random table is needed and keys agree across copies within a process.
+    return hash((x, y, value))
+
+
+class HashedGrid(Grid[T]):
+    # A Grid that keeps an XOR-of-cells hash up to date on every set/swap_items, so comparing
+    # or remembering states costs O(1) instead of a full snapshot. Rows handed out by
+    # iteration must not be mutated directly, or the hash goes stale.
+    def __init__(self, data: Sequence[Sequence[T]]) -> None:
+        super().__init__(data)
+        state_hash = 0
+        for x, row in enumerate(self._data):
+            for y, value in enumerate(row):
+                state_hash ^= _cell_key(x, y, value)
+        self._hash = state_hash
+
+    @staticmethod
+    def from_grid(grid: Grid[T]) -> "HashedGrid[T]":
+        return HashedGrid(list(grid))
+
+    @property
+    def state_hash(self) -> int:
+        return self._hash
+
+    def set(self, point: Point, value: T) -> None:
+        if self.out_of_bounds(point):
+            raise IndexError("Point is outside grid bounds.")
+        row = self._data[point.x]
+        previous = row[point.y]
+        if previous == value:
+            return
+        row[point.y] = value
+        self._hash ^= _cell_key(point.x, point.y, previous) ^ _cell_key(point.x, point.y, value)
+
+    def swap_items(self, point_a: Point, point_b: Point) -> None:
+        if self.out_of_bounds(point_a) or self.out_of_bounds(point_b):
+            raise IndexError("Cannot swap items outside grid bounds.")
+        value_a = self._data[point_a.x][point_a.y]
+        value_b = self._data[point_b.x][point_b.y]
+        if value_a == value_b:
+            return
+        self._data[point_a.x][point_a.y] = value_b
+        self._data[point_b.x][point_b.y] = value_a
+        self._hash ^= (
+            _cell_key(point_a.x, point_a.y, value_a)
+            ^ _cell_key(point_a.x, point_a.y, value_b)
+            ^ _cell_key(point_b.x, point_b.y, value_b)
+            ^ _cell_key(point_b.x, point_b.y, value_a)
+        )
+
+    def copy(self) -> "HashedGrid[T]":
+        clone: HashedGrid[T] = HashedGrid.__new__(HashedGrid)
+        clone._data = [row[:] for row in self._data]
+        clone._hash = self._hash
+        return clone
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, HashedGrid):
+            return NotImplemented
+        return self._hash == other._hash and self._data == other._data
+
+    def __hash__(self) -> int:
+        return self._hash
+
+
+__all__ = ["HashedGrid"]
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import re
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, Sequence
+
+_RANGE_PATTERNS: dict[str, re.Pattern[str]] = {}
+
+
+def parse_range(line: str, separator: str = "-") -> tuple[int, int]:
+    # "3-5" -> (3, 5). Works as a load_lines converter; negative bounds ("-4--2") are allowed.
+    pattern = _RANGE_PATTERNS.get(separator)
+    if pattern is None:
+        pattern = re.compile(rf"\s*(-?\d+)\s*{re.escape(separator)}\s*(-?\d+)\s*")
+        _RANGE_PATTERNS[separator] = pattern
+    match = pattern.fullmatch(line)
+    if match is None:
+        raise ValueError(f"Not a range: {line!r}")
+    return int(match.group(1)), int(match.group(2))
+
+
+class IntervalSet:
+    # Inclusive integer spans kept sorted, disjoint and non-adjacent in two parallel lists, so
+    # lookups are a bisect over the starts.
+    def __init__(self, spans: Iterable[tuple[int, int]] = ()) -> None:
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        for low, high in sorted((low, high) for low, high in spans if low <= high):
+            if self._ends and low <= self._ends[-1] + 1:
+                if high > self._ends[-1]:
+                    self._ends[-1] = high
+            else:
+                self._starts.append(low)
+                self._ends.append(high)
+
+    @staticmethod
+    def from_lines(lines: Iterable[str], separator: str = "-") -> "IntervalSet":
+        return IntervalSet(parse_range(line, separator) for line in lines)
+
+    def add(self, low: int, high: int) -> None:
+        if low > high:
+            return
+        # Every span touching [low - 1, high + 1] is absorbed into the new one.
+        first = bisect_left(self._ends, low - 1)
+        last = bisect_right(self._starts, high + 1)
+        if first < last:
+            low = min(low, self._starts[first])
+            high = max(high, self._ends[last - 1])
+        self._starts[first:last] = [low]
+        self._ends[first:last] = [high]
+
+    def remove(self, low: int, high: int) -> None:
+        if low > high:
+            return
+        first = bisect_left(self._ends, low)
+        last = bisect_right(self._starts, high)
+        if first >= last:
+            return
+        starts: list[int] = []
+        ends: list[int] = []
+        if self._starts[first] < low:
+            starts.append(self._starts[first])
+            ends.append(low - 1)
+        if self._ends[last - 1] > high:
+            starts.append(high + 1)
+            ends.append(self._ends[last - 1])
+        self._starts[first:last] = starts
+        self._ends[first:last] = ends
+
+    def find(self, value: int) -> tuple[int, int] | None:
+        index = bisect_right(self._starts, value) - 1
+        if index >= 0 and value <= self._ends[index]:
+            return self._starts[index], self._ends[index]
+        return None
+
+    def __contains__(self, value: int) -> bool:
+        index = bisect_right(self._starts, value) - 1
+        return index >= 0 and value <= self._ends[index]
+
+    def contains_many(self, values: Sequence[int]) -> list[bool]:
+        # One merge-style sweep over sorted values and spans instead of a bisect per value.
+        starts = self._starts
+        ends = self._ends
+        count = len(starts)
+        index = 0
+        previous = None
+        result = []
+        for value in values:
+            if previous is not None and value < previous:
+                raise ValueError("contains_many expects values in ascending order.")
+            previous = value
+            while index < count and ends[index] < value:
+                index += 1
+            result.append(index < count and starts[index] <= value)
+        return result
+
+    def count_contained(self, values: Sequence[int]) -> int:
+        return sum(self.contains_many(values))
+
+    def total_length(self) -> int:
+        return sum(self._ends) - sum(self._starts) + len(self._starts)
+
+    def bounds(self) -> tuple[int, int] | None:
+        if not self._starts:
+            return None
+        return self._starts[0], self._ends[-1]
+
+    def union(self, other: "IntervalSet") -> "IntervalSet":
+        return IntervalSet([*self, *other])
+
+    def intersection(self, other: "IntervalSet") -> "IntervalSet":
+        spans = []
+        left = list(self)
+        right = list(other)
+        i = j = 0
+        while i < len(left) and j < len(right):
+            low = max(left[i][0], right[j][0])
+            high = min(left[i][1], right[j][1])
+            if low <= high:
+                spans.append((low, high))
+            if left[i][1] < right[j][1]:
+                i += 1
+            else:
+                j += 1
+        return IntervalSet._from_sorted(spans)
+
+    def difference(self, other: "IntervalSet") -> "IntervalSet":
+        spans = []
+        removals = list(other)
+        j = 0
+        for low, high in self:
+            while j < len(removals) and removals[j][1] < low:
+                j += 1
+            k = j
+            while low <= high and k < len(removals) and removals[k][0] <= high:
+                if removals[k][0] > low:
+                    spans.append((low, removals[k][0] - 1))
+                low = max(low, removals[k][1] + 1)
+                k += 1
+            if low <= high:
+                spans.append((low, high))
+        return IntervalSet._from_sorted(spans)
+
+    def complement(self, low: int, high: int) -> "IntervalSet":
+        return IntervalSet([(low, high)]).difference(self)
+
+    def __or__(self, other: "IntervalSet") -> "IntervalSet":
+        return self.union(other)
+
+    def __and__(self, other: "IntervalSet") -> "IntervalSet":
+        return self.intersection(other)
+
+    def __sub__(self, other: "IntervalSet") -> "IntervalSet":
+        return self.difference(other)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return zip(self._starts, self._ends)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __bool__(self) -> bool:
+        return bool(self._starts)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self._starts == other._starts and self._ends == other._ends
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)!r})"
+
+    @staticmethod
+    def _from_sorted(spans: list[tuple[int, int]]) -> "IntervalSet":
+        # Spans from the set operations are already ordered and disjoint, but may touch.
+        result = IntervalSet()
+        for low, high in spans:
+            if result._ends and low <= result._ends[-1] + 1:
+                result._ends[-1] = max(result._ends[-1], high)
+            else:
+                result._starts.append(low)
+                result._ends.append(high)
+        return result
+
+
+__all__ = ["IntervalSet", "parse_range"]
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+from array import array
+from typing import Any, Iterable, Iterator, Protocol
+
+from .grid import Point
+
+
+class _GridShape(Protocol):
+    @property
+    def height(self) -> int: ...
+
+    @property
+    def width(self) -> int: ...
+
+
+class _GridBound:
+    # Shared flat-index addressing: index = x * width + y, the same layout CompactGrid and
+    # helpers.search use, so indices can be passed between them without conversion.
+    def __init__(self, grid: _GridShape) -> None:
+        self.width = grid.width
+        self.height = grid.height
+        self.size = self.width * self.height
+
+    def index_of(self, point: Point) -> int:
+        if not (0 <= point.x < self.height and 0 <= point.y < self.width):
+            raise IndexError("Point is outside grid bounds.")
+        return point.x * self.width + point.y
+
+    def point_of(self, index: int) -> Point:
+        return Point(*divmod(index, self.width))
+
+    def _in_bounds(self, point: Point) -> bool:
+        return 0 <= point.x < self.height and 0 <= point.y < self.width
+
+    def _check_shape(self, other: "_GridBound") -> None:
+        if (other.width, other.height) != (self.width, self.height):
+            raise ValueError("Point collections must share grid dimensions.")
+
+
+class PointSet(_GridBound):
+    # One bit per cell, little-endian within each byte.
+    def __init__(self, grid: _GridShape, points: Iterable[Point] = ()) -> None:
+        super().__init__(grid)
+        self._bits = bytearray((self.size + 7) >> 3)
+        self._count = 0
+        for point in points:
+            self.add(point)
+
+    @staticmethod
+    def from_indices(grid: _GridShape, indices: Iterable[int]) -> "PointSet":
+        result = PointSet(grid)
+        for index in indices:
+            result.add_index(index)
+        return result
+
+    def add(self, point: Point) -> None:
+        self.add_index(self.index_of(point))
+
+    def discard(self, point: Point) -> None:
+        if self._in_bounds(point):
+            self.discard_index(point.x * self.width + point.y)
+
+    def update(self, points: Iterable[Point]) -> None:
+        for point in points:
+            self.add(point)
+
+    def add_index(self, index: int) -> bool:
+        # Returns True when the index was not already present, which is the BFS "first visit"
+        # test and the insert in one call.
+        mask = 1 << (index & 7)
+        byte = self._bits[index >> 3]
+        if byte & mask:
+            return False
+        self._bits[index >> 3] = byte | mask
+        self._count += 1
+        return True
+
+    def discard_index(self, index: int) -> None:
+        mask = 1 << (index & 7)
+        byte = self._bits[index >> 3]
+        if byte & mask:
+            self._bits[index >> 3] = byte & ~mask
+            self._count -= 1
+
+    def contains_index(self, index: int) -> bool:
+        return bool(self._bits[index >> 3] >> (index & 7) & 1)
+
+    def __contains__(self, point: object) -> bool:
+        if not isinstance(point, Point) or not self._in_bounds(point):
+            return False
+        index = point.x * self.width + point.y
+        return bool(self._bits[index >> 3] >> (index & 7) & 1)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    def indices(self) -> Iterator[int]:
+        # Row-major, skipping empty bytes whole.
+        for offset, byte in enumerate(self._bits):
+            if not byte:
+                continue
+            base = offset << 3
+            while byte:
+                low = byte & -byte
+                yield base + low.bit_length() - 1
+                byte ^= low
+
+    def __iter__(self) -> Iterator[Point]:
+        width = self.width
+        for index in self.indices():
+            yield Point(*divmod(index, width))
+
+    def to_set(self) -> set[Point]:
+        return set(self)
+
+    def copy(self) -> "PointSet":
+        return self._with_bits(bytes(self._bits))
+
+    def clear(self) -> None:
+        self._bits = bytearray(len(self._bits))
+        self._count = 0
+
+    def __or__(self, other: "PointSet") -> "PointSet":
+        return self._combine(other, lambda a, b: a | b)
+
+    def __and__(self, other: "PointSet") -> "PointSet":
+        return self._combine(other, lambda a, b: a & b)
+
+    def __xor__(self, other: "PointSet") -> "PointSet":
+        return self._combine(other, lambda a, b: a ^ b)
+
+    def __sub__(self, other: "PointSet") -> "PointSet":
+        return self._combine(other, lambda a, b: a & ~b)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PointSet):
+            return NotImplemented
+        return (self.width, self.height) == (other.width, other.height) and (
+            self._bits == other._bits
+        )
+
+    def _combine(self, other: "PointSet", operation: Any) -> "PointSet":
+        # Whole-set algebra runs as one big-int operation over the packed bytes.
+        self._check_shape(other)
+        left = int.from_bytes(self._bits, "little")
+        right = int.from_bytes(other._bits, "little")
+        combined = operation(left, right) & ((1 << self.size) - 1)
+        return self._with_bits(combined.to_bytes(len(self._bits), "little"))
+
+    def _with_bits(self, bits: bytes) -> "PointSet":
+        result = PointSet(self)
+        result._bits = bytearray(bits)
+        result._count = int.from_bytes(bits, "little").bit_count()
+        return result
+
+
+class PointMap(_GridBound):
+    # A dense array with a sentinel for "absent": get/set are one index computation and no
+    # hashing. The typecode bounds the values ("q" for distances, "b"/"B" for small states).
+    # Hot loops may read and write `data` directly by flat index.
+    def __init__(self, grid: _GridShape, typecode: str = "q", missing: int = -1) -> None:
+        super().__init__(grid)
+        self.missing = missing
+        self.data = array(typecode, [missing]) * self.size
+
+    def get_index(self, index: int, default: Any = None) -> Any:
+        value = self.data[index]
+        return default if value == self.missing else value
+
+    def set_index(self, index: int, value: int) -> None:
+        if value == self.missing:
+            raise ValueError("Cannot store the PointMap sentinel value; delete the key instead.")
+        self.data[index] = value
+
+    def delete_index(self, index: int) -> None:
+        self.data[index] = self.missing
+
+    def contains_index(self, index: int) -> bool:
+        return self.data[index] != self.missing
+
+    def get(self, point: Point, default: Any = None) -> Any:
+        if not self._in_bounds(point):
+            return default
+        return self.get_index(point.x * self.width + point.y, default)
+
+    def __getitem__(self, point: Point) -> int:
+        value = self.get(point, self.missing)
+        if value == self.missing:
+            raise KeyError(point)
+        return value
+
+    def __setitem__(self, point: Point, value: int) -> None:
+        self.set_index(self.index_of(point), value)
+
+    def __delitem__(self, point: Point) -> None:
+        index = self.index_of(point)
+        if self.data[index] == self.missing:
+            raise KeyError(point)
+        self.delete_index(index)
+
+    def __contains__(self, point: object) -> bool:
+        if not isinstance(point, Point) or not self._in_bounds(point):
+            return False
+        return self.data[point.x * self.width + point.y] != self.missing
+
+    def __len__(self) -> int:
+        return len(self.data) - self.data.count(self.missing)
+
+    def indices(self) -> Iterator[int]:
+        missing = self.missing
+        return (index for index, value in enumerate(self.data) if value != missing)
+
+    def keys(self) -> Iterator[Point]:
+        width = self.width
+        return (Point(*divmod(index, width)) for index in self.indices())
+
+    __iter__ = keys
+
+    def values(self) -> Iterator[int]:
+        missing = self.missing
+        return (value for value in self.data if value != missing)
+
+    def items(self) -> Iterator[tuple[Point, int]]:
+        width = self.width
+        missing = self.missing
+        for index, value in enumerate(self.data):
+            if value != missing:
+                yield Point(*divmod(index, width)), value
+
+    def key_set(self) -> PointSet:
+        return PointSet.from_indices(self, self.indices())
+
+    def to_dict(self) -> dict[Point, int]:
+        return dict(self.items())
+
+    def copy(self) -> "PointMap":
+        result = PointMap(self, self.data.typecode, self.missing)
+        result.data = array(self.data.typecode, self.data)
+        return result
+
+
+__all__ = ["PointMap", "PointSet"]
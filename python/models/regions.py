@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from typing import Any, Iterable, Sequence
+
+from .grid import Point
+
+_CARDINALS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+_DIAGONALS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+class RegionMap:
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        labels: array,
+        values: list[Any],
+        areas: list[int],
+        perimeters: list[int],
+        sides: list[int],
+    ) -> None:
+        self.width = width
+        self.height = height
+        self.labels = labels
+        self.values = values
+        self.areas = areas
+        self.perimeters = perimeters
+        self.sides = sides
+
+    @property
+    def region_count(self) -> int:
+        return len(self.areas)
+
+    def label_at(self, point: Point) -> int:
+        if not (0 <= point.x < self.height and 0 <= point.y < self.width):
+            return -1
+        return self.labels[point.x * self.width + point.y]
+
+    def points(self, label: int) -> list[Point]:
+        width = self.width
+        return [
+            Point(*divmod(index, width)) for index, value in enumerate(self.labels) if value == label
+        ]
+
+
+def region_perimeter(points: Iterable[Point], label_map: RegionMap) -> list[Point]:
+    perimeter: list[Point] = []
+    for point in points:
+        label = label_map.label_at(point)
+        for dx, dy in _CARDINALS:
+            neighbor = Point(point.x + dx, point.y + dy)
+            if label_map.label_at(neighbor) != label:
+                perimeter.append(neighbor)
+    return perimeter
+
+
+def label_regions(width: int, height: int, cells: Sequence[Any]) -> RegionMap:
+    size = width * height
+    labels = array("l", [-1]) * size
+    values: list[Any] = []
+    areas: list[int] = []
+
+    for seed in range(size):
+        if labels[seed] != -1:
+            continue
+
+        label = len(areas)
+        value = cells[seed]
+        labels[seed] = label
+        queue = deque((seed,))
+        area = 0
+
+        while queue:
+            current = queue.popleft()
+            area += 1
+            y = current % width
+            if current >= width:
+                neighbor = current - width
+                if labels[neighbor] == -1 and cells[neighbor] == value:
+                    labels[neighbor] = label
+                    queue.append(neighbor)
+            if current + width < size:
+                neighbor = current + width
+                if labels[neighbor] == -1 and cells[neighbor] == value:
+                    labels[neighbor] = label
+                    queue.append(neighbor)
+            if y > 0:
+                neighbor = current - 1
+                if labels[neighbor] == -1 and cells[neighbor] == value:
+                    labels[neighbor] = label
+                    queue.append(neighbor)
+            if y < width - 1:
+                neighbor = current + 1
+                if labels[neighbor] == -1 and cells[neighbor] == value:
+                    labels[neighbor] = label
+                    queue.append(neighbor)
+
+        values.append(value)
+        areas.append(area)
+
+    perimeters = [0] * len(areas)
+    sides = [0] * len(areas)
+
+    def same(x: int, y: int, label: int) -> bool:
+        return 0 <= x < height and 0 <= y < width and labels[x * width + y] == label
+
+    for index in range(size):
+        label = labels[index]
+        x, y = divmod(index, width)
+
+        fences = 4
+        if x > 0 and labels[index - width] == label:
+            fences -= 1
+        if x < height - 1 and labels[index + width] == label:
+            fences -= 1
+        if y > 0 and labels[index - 1] == label:
+            fences -= 1
+        if y < width - 1 and labels[index + 1] == label:
+            fences -= 1
+        perimeters[label] += fences
+
+        if fences == 0 and x > 0 and y > 0 and x < height - 1 and y < width - 1:
+            # Interior cells can only contribute concave corners.
+            for dx, dy in _DIAGONALS:
+                if labels[(x + dx) * width + y + dy] != label:
+                    sides[label] += 1
+            continue
+
+        # Each corner of a region's outline starts exactly one side.
+        for dx, dy in _DIAGONALS:
+            vertical = same(x + dx, y, label)
+            horizontal = same(x, y + dy, label)
+            if not vertical and not horizontal:
+                sides[label] += 1
+            elif vertical and horizontal and not same(x + dx, y + dy, label):
+                sides[label] += 1
+
+    return RegionMap(width, height, labels, values, areas, perimeters, sides)
+
+
+__all__ = ["RegionMap", "label_regions", "region_perimeter"]
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from enum import Enum
+from types import MappingProxyType
 from typing import Any, Mapping
 
 SOLUTION_CONFIG_KEY = "Solution"
@@ -17,37 +18,126 @@ class RunType(str, Enum):
     FULL = "Full"
 
 
-@dataclass
+@dataclass(frozen=True)
+class SolveBudget:
+    wall_seconds: float | None = None
+    cpu_seconds: float | None = None
+    memory_mb: float | None = None
+
+    @property
+    def unlimited(self) -> bool:
+        return self.wall_seconds is None and self.cpu_seconds is None and self.memory_mb is None
+
+    @staticmethod
+    def from_dict(data: Mapping[str, Any], fallback: "SolveBudget | None" = None) -> "SolveBudget":
+        # Keys missing from data keep the fallback's value, so per-day entries only override
+        # the limits they mention. Zero or negative values mean "no limit".
+        base = fallback or SolveBudget()
+        return SolveBudget(
+            SolveBudget._parse_limit(data, "WallSeconds", base.wall_seconds),
+            SolveBudget._parse_limit(data, "CpuSeconds", base.cpu_seconds),
+            SolveBudget._parse_limit(data, "MemoryMb", base.memory_mb),
+        )
+
+    @staticmethod
+    def _parse_limit(data: Mapping[str, Any], key: str, fallback: float | None) -> float | None:
+        camel = key[0].lower() + key[1:]
+        if key not in data and camel not in data:
+            return fallback
+        value = data.get(key, data.get(camel))
+        if isinstance(value, str):
+            try:
+                value = float(value.strip())
+            except ValueError:
+                return fallback
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return fallback
+        return float(value) if value > 0 else None
+
+
+@dataclass(frozen=True)
 class SolutionOptions:
     day: int = 1
     solution_type: SolutionType = SolutionType.FIRST
     run_type: RunType = RunType.TEST
+    use_input_cache: bool = False
+    budget: SolveBudget = field(default_factory=SolveBudget)
+    day_budgets: Mapping[int, SolveBudget] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        # Every copy gets a read-only view of its own dict, so per-job copies handed to
+        # run-all workers can never change each other's budgets.
+        object.__setattr__(self, "day_budgets", MappingProxyType(dict(self.day_budgets)))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # mappingproxy does not pickle, and options travel to pool workers.
+        return SolutionOptions, (
+            self.day,
+            self.solution_type,
+            self.run_type,
+            self.use_input_cache,
+            self.budget,
+            dict(self.day_budgets),
+        )
 
     @staticmethod
     def from_dict(data: Mapping[str, Any]) -> "SolutionOptions":
-        options = SolutionOptions()
-        options.apply(data)
-        return options
+        return SolutionOptions().apply(data)
 
-    def apply(self, data: Mapping[str, Any]) -> None:
+    def copy_with(self, **changes: Any) -> "SolutionOptions":
+        return replace(self, **changes)
+
+    def budget_for(self, day: int | None = None) -> SolveBudget:
+        return self.day_budgets.get(self.day if day is None else day, self.budget)
+
+    def apply(self, data: Mapping[str, Any]) -> "SolutionOptions":
+        changes: dict[str, Any] = {}
         if "Day" in data or "day" in data:
             day_value = data.get("Day", data.get("day"))
             if isinstance(day_value, str):
                 day_value = day_value.strip()
                 if day_value.isdigit():
-                    self.day = int(day_value)
+                    changes["day"] = int(day_value)
             elif isinstance(day_value, (int, float)):
-                self.day = int(day_value)
+                changes["day"] = int(day_value)
 
         if "SolutionType" in data or "solutionType" in data:
             raw_value = data.get("SolutionType", data.get("solutionType"))
             parsed = self._parse_enum(raw_value, SolutionType, self.solution_type)
-            self.solution_type = parsed
+            changes["solution_type"] = parsed
 
         if "RunType" in data or "runType" in data:
             raw_value = data.get("RunType", data.get("runType"))
             parsed = self._parse_enum(raw_value, RunType, self.run_type)
-            self.run_type = parsed
+            changes["run_type"] = parsed
+
+        if "UseInputCache" in data or "useInputCache" in data:
+            raw_value = data.get("UseInputCache", data.get("useInputCache"))
+            changes["use_input_cache"] = self._parse_bool(raw_value, self.use_input_cache)
+
+        if "Budget" in data or "budget" in data:
+            raw_value = data.get("Budget", data.get("budget"))
+            if isinstance(raw_value, Mapping):
+                budget = changes["budget"] = SolveBudget.from_dict(raw_value, self.budget)
+                days = raw_value.get("Days", raw_value.get("days", {}))
+                if isinstance(days, Mapping):
+                    changes["day_budgets"] = {
+                        int(day): SolveBudget.from_dict(limits, budget)
+                        for day, limits in days.items()
+                        if str(day).strip().isdigit() and isinstance(limits, Mapping)
+                    }
+
+        return self.copy_with(**changes)
+
+    @staticmethod
+    def _parse_bool(value: Any, fallback: bool) -> bool:
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str):
+            normalized = value.strip().lower()
+            if normalized in {"true", "false"}:
+                return normalized == "true"
+        return fallback
 
     @staticmethod
     def _parse_enum(value: Any, enum_type: type[Enum], fallback: Enum) -> Enum:
@@ -63,5 +153,5 @@ class SolutionOptions:
         return fallback
 
 
-__all__ = ["SolutionOptions", "SolutionType", "RunType", "SOLUTION_CONFIG_KEY"]
+__all__ = ["SolutionOptions", "SolutionType", "SolveBudget", "RunType", "SOLUTION_CONFIG_KEY"]
 
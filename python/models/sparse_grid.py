@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Generic, Iterable, Iterator, Sequence, TypeVar
+
+from .grid import Grid, Point
+
+T = TypeVar("T")
+
+DEFAULT_CHUNK_BITS = 4
+
+_CARDINAL_STEPS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+class SparseGrid(Generic[T]):
+    def __init__(
+        self,
+        default: T | None = None,
+        data: Sequence[Sequence[T]] | None = None,
+        chunk_bits: int = DEFAULT_CHUNK_BITS,
+    ) -> None:
+        self._default = default
+        self._bits = chunk_bits
+        self._mask = (1 << chunk_bits) - 1
+        self._chunk_cells = 1 << (2 * chunk_bits)
+        self._chunks: dict[tuple[int, int], list[T | None]] = {}
+        self._counts: dict[tuple[int, int], int] = {}
+        self._bounds: tuple[int, int, int, int] | None = None
+        self._bounds_dirty = False
+        if data is not None:
+            for x, row in enumerate(data):
+                for y, value in enumerate(row):
+                    self.set(Point(x, y), value)
+
+    @property
+    def default(self) -> T | None:
+        return self._default
+
+    @property
+    def chunk_count(self) -> int:
+        return len(self._chunks)
+
+    def bounds(self) -> tuple[Point, Point] | None:
+        # Inclusive (min, max) corners of every non-default cell, or None when empty.
+        if self._bounds_dirty:
+            self._recompute_bounds()
+        if self._bounds is None:
+            return None
+        min_x, min_y, max_x, max_y = self._bounds
+        return Point(min_x, min_y), Point(max_x, max_y)
+
+    @property
+    def height(self) -> int:
+        corners = self.bounds()
+        return 0 if corners is None else corners[1].x - corners[0].x + 1
+
+    @property
+    def width(self) -> int:
+        corners = self.bounds()
+        return 0 if corners is None else corners[1].y - corners[0].y + 1
+
+    def get(self, point: Point) -> T | None:
+        chunk = self._chunks.get((point.x >> self._bits, point.y >> self._bits))
+        if chunk is None:
+            return self._default
+        return chunk[((point.x & self._mask) << self._bits) | (point.y & self._mask)]
+
+    def set(self, point: Point, value: T) -> None:
+        key = (point.x >> self._bits, point.y >> self._bits)
+        offset = ((point.x & self._mask) << self._bits) | (point.y & self._mask)
+        chunk = self._chunks.get(key)
+        default = self._default
+
+        if value == default:
+            if chunk is None or chunk[offset] == default:
+                return
+            chunk[offset] = default
+            self._counts[key] -= 1
+            if not self._counts[key]:
+                del self._chunks[key]
+                del self._counts[key]
+            if self._bounds is not None:
+                min_x, min_y, max_x, max_y = self._bounds
+                if point.x in (min_x, max_x) or point.y in (min_y, max_y):
+                    self._bounds_dirty = True
+            return
+
+        if chunk is None:
+            chunk = self._chunks[key] = [default] * self._chunk_cells
+            self._counts[key] = 0
+        if chunk[offset] == default:
+            self._counts[key] += 1
+        chunk[offset] = value
+
+        if self._bounds is None:
+            self._bounds = (point.x, point.y, point.x, point.y)
+        elif not self._bounds_dirty:
+            min_x, min_y, max_x, max_y = self._bounds
+            if not (min_x <= point.x <= max_x and min_y <= point.y <= max_y):
+                self._bounds = (
+                    min(min_x, point.x),
+                    min(min_y, point.y),
+                    max(max_x, point.x),
+                    max(max_y, point.y),
+                )
+
+    def copy(self) -> "SparseGrid[T]":
+        clone: SparseGrid[T] = SparseGrid(self._default, chunk_bits=self._bits)
+        clone._chunks = {key: chunk[:] for key, chunk in self._chunks.items()}
+        clone._counts = dict(self._counts)
+        clone._bounds = self._bounds
+        clone._bounds_dirty = self._bounds_dirty
+        return clone
+
+    def to_grid(self) -> Grid[T | None]:
+        return Grid(list(self))
+
+    def chunks(self) -> Iterator[tuple[Point, list[T | None]]]:
+        # Each allocated chunk as (top-left corner, row-major cells); unallocated ones are all
+        # default and never visited.
+        bits = self._bits
+        for (chunk_x, chunk_y), chunk in self._chunks.items():
+            yield Point(chunk_x << bits, chunk_y << bits), chunk
+
+    def cells(self) -> Iterator[tuple[int, int, T]]:
+        # Like items() but yields raw (x, y, value) tuples, skipping the Point allocation.
+        return self._cells_in(self._chunks)
+
+    def items(self) -> Iterator[tuple[Point, T]]:
+        for x, y, value in self.cells():
+            yield Point(x, y), value
+
+    def __len__(self) -> int:
+        return sum(self._counts.values())
+
+    def get_unique_items(self) -> list[T]:
+        unique: dict[T, None] = {}
+        for _, _, value in self.cells():
+            unique.setdefault(value, None)
+        return list(unique)
+
+    def find_items(self, target: T) -> list[Point]:
+        if target == self._default:
+            return [point for point in self._bounded_points() if self.get(point) == target]
+        return [Point(x, y) for x, y, value in self.cells() if value == target]
+
+    def find_connected_region(self, start: Point) -> list[Point]:
+        # A region of default cells would be infinite, so it is clipped to the bounding box
+        # grown by one cell on every side.
+        start_value = self.get(start)
+        limits = None
+        if start_value == self._default:
+            corners = self.bounds()
+            if corners is None:
+                return [start]
+            low, high = corners
+            limits = (
+                min(low.x, start.x) - 1,
+                min(low.y, start.y) - 1,
+                max(high.x, start.x) + 1,
+                max(high.y, start.y) + 1,
+            )
+
+        visited = {start}
+        queue = deque((start,))
+        region: list[Point] = []
+        while queue:
+            current = queue.popleft()
+            region.append(current)
+            for dx, dy in _CARDINAL_STEPS:
+                neighbor = Point(current.x + dx, current.y + dy)
+                if neighbor in visited:
+                    continue
+                if limits is not None and not (
+                    limits[0] <= neighbor.x <= limits[2] and limits[1] <= neighbor.y <= limits[3]
+                ):
+                    continue
+                if self.get(neighbor) == start_value:
+                    visited.add(neighbor)
+                    queue.append(neighbor)
+        return region
+
+    def calculate_region_perimeter(self, points: Iterable[Point]) -> list[Point]:
+        point_set = set(points)
+        perimeter: list[Point] = []
+        for point in point_set:
+            for dx, dy in _CARDINAL_STEPS:
+                neighbor = Point(point.x + dx, point.y + dy)
+                if neighbor not in point_set:
+                    perimeter.append(neighbor)
+        return perimeter
+
+    def swap_items(self, point_a: Point, point_b: Point) -> None:
+        value_a = self.get(point_a)
+        value_b = self.get(point_b)
+        self.set(point_a, value_b)  # type: ignore[arg-type]
+        self.set(point_b, value_a)  # type: ignore[arg-type]
+
+    def get_adjacent_item(self, point: Point, offset: Point) -> tuple[Point, T | None]:
+        neighbor = Point(point.x + offset.x, point.y + offset.y)
+        return neighbor, self.get(neighbor)
+
+    def get_surrounding_items(self, point: Point) -> list[Point]:
+        return [Point(point.x + dx, point.y + dy) for dx, dy in _CARDINAL_STEPS]
+
+    def out_of_bounds(self, point: Point) -> bool:
+        return False
+
+    def to_strings(self, mapper: callable | None = None) -> list[str]:
+        mapper = mapper or (lambda value: str(value))
+        return ["".join(mapper(value) for value in row) for row in self]
+
+    def __iter__(self) -> Iterator[list[T | None]]:
+        corners = self.bounds()
+        if corners is None:
+            return
+        low, high = corners
+        for x in range(low.x, high.x + 1):
+            yield [self.get(Point(x, y)) for y in range(low.y, high.y + 1)]
+
+    def _cells_in(self, keys: Iterable[tuple[int, int]]) -> Iterator[tuple[int, int, T]]:
+        bits = self._bits
+        mask = self._mask
+        default = self._default
+        for chunk_x, chunk_y in keys:
+            chunk = self._chunks[(chunk_x, chunk_y)]
+            base_x = chunk_x << bits
+            base_y = chunk_y << bits
+            for offset in [offset for offset, value in enumerate(chunk) if value != default]:
+                yield base_x + (offset >> bits), base_y + (offset & mask), chunk[offset]
+
+    def _bounded_points(self) -> Iterator[Point]:
+        corners = self.bounds()
+        if corners is None:
+            return
+        low, high = corners
+        for x in range(low.x, high.x + 1):
+            for y in range(low.y, high.y + 1):
+                yield Point(x, y)
+
+    def _recompute_bounds(self) -> None:
+        self._bounds_dirty = False
+        if not self._chunks:
+            self._bounds = None
+            return
+
+        # Only the extreme chunks on each side can hold the extreme cells.
+        keys = self._chunks.keys()
+        low_x = min(key[0] for key in keys)
+        high_x = max(key[0] for key in keys)
+        low_y = min(key[1] for key in keys)
+        high_y = max(key[1] for key in keys)
+        xs: list[int] = []
+        ys: list[int] = []
+        for x, y, _ in self._cells_in(
+            key for key in keys if key[0] in (low_x, high_x) or key[1] in (low_y, high_y)
+        ):
+            xs.append(x)
+            ys.append(y)
+        min_x, max_x, min_y, max_y = min(xs), max(xs), min(ys), max(ys)
+        self._bounds = (min_x, min_y, max_x, max_y)  # type: ignore[assignment]
+
+
+__all__ = ["DEFAULT_CHUNK_BITS", "SparseGrid"]
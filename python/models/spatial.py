@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass
+from typing import Iterator, Sequence, Union
+
+
+@dataclass(frozen=True)
+class PointN:
+    coordinates: tuple[int, ...]
+
+    @staticmethod
+    def parse(text: str, separator: str = ",") -> "PointN":
+        return PointN(tuple(int(part) for part in text.split(separator)))
+
+    @property
+    def dimensions(self) -> int:
+        return len(self.coordinates)
+
+    @property
+    def x(self) -> int:
+        return self.coordinates[0]
+
+    @property
+    def y(self) -> int:
+        return self.coordinates[1]
+
+    @property
+    def z(self) -> int:
+        return self.coordinates[2]
+
+    def distance_squared(self, other: "PointN") -> int:
+        return sum((a - b) * (a - b) for a, b in zip(self.coordinates, other.coordinates))
+
+    def manhattan(self, other: "PointN") -> int:
+        return sum(abs(a - b) for a, b in zip(self.coordinates, other.coordinates))
+
+
+def parse_point(line: str) -> PointN:
+    # load_lines converter for "x,y,z" style rows.
+    return PointN.parse(line)
+
+
+# Ranges this small are scanned directly; below this size recursion costs more than it prunes.
+_LEAF_SIZE = 8
+
+Coordinates = Union[PointN, Sequence[int]]
+
+
+def _coordinates(point: Coordinates) -> tuple[int, ...]:
+    return point.coordinates if isinstance(point, PointN) else tuple(point)
+
+
+class KDTree:
+    # Implicit k-d tree: the index list itself is the tree. The median of order[lo:hi] is the
+    # node splitting that range on axis depth % dimensions, so no node objects are allocated.
+    # Distances are squared Euclidean, which keeps integer inputs exact.
+    def __init__(self, points: Sequence[Coordinates]) -> None:
+        self.points: list[tuple[int, ...]] = [_coordinates(point) for point in points]
+        self.dimensions = len(self.points[0]) if self.points else 0
+        if any(len(point) != self.dimensions for point in self.points):
+            raise ValueError("KDTree points must all have the same number of dimensions.")
+        self._order = list(range(len(self.points)))
+        self._build(0, len(self._order), 0)
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def nearest(self, target: Coordinates, exclude: int | None = None) -> tuple[int, int] | None:
+        found = self.k_nearest(target, 1, exclude)
+        return found[0] if found else None
+
+    def k_nearest(
+        self, target: Coordinates, k: int, exclude: int | None = None, min_index: int = 0
+    ) -> list[tuple[int, int]]:
+        # Returns up to k (distance_squared, index) pairs ordered by distance, then index,
+        # considering only points with index >= min_index.
+        coordinates = _coordinates(target)
+        points = self.points
+        order = self._order
+        dimensions = self.dimensions
+        heap: list[tuple[int, int]] = []
+
+        def consider(index: int) -> None:
+            if index < min_index:
+                return
+            point = points[index]
+            distance = 0
+            for a, b in zip(point, coordinates):
+                distance += (a - b) * (a - b)
+            if len(heap) < k:
+                heapq.heappush(heap, (-distance, -index))
+            elif distance < -heap[0][0] or (distance == -heap[0][0] and index < -heap[0][1]):
+                heapq.heapreplace(heap, (-distance, -index))
+
+        def search(lo: int, hi: int, depth: int) -> None:
+            if hi - lo <= _LEAF_SIZE:
+                for index in order[lo:hi]:
+                    if index != exclude:
+                        consider(index)
+                return
+            mid = (lo + hi) >> 1
+            index = order[mid]
+            point = points[index]
+            if index != exclude:
+                consider(index)
+            axis = depth % dimensions
+            diff = coordinates[axis] - point[axis]
+            if diff < 0:
+                search(lo, mid, depth + 1)
+                if len(heap) < k or diff * diff <= -heap[0][0]:
+                    search(mid + 1, hi, depth + 1)
+            else:
+                search(mid + 1, hi, depth + 1)
+                if len(heap) < k or diff * diff <= -heap[0][0]:
+                    search(lo, mid, depth + 1)
+
+        if k > 0:
+            search(0, len(order), 0)
+        return sorted((-distance, -index) for distance, index in heap)
+
+    def within(self, target: Coordinates, radius: float) -> list[int]:
+        coordinates = _coordinates(target)
+        limit = radius * radius
+        points = self.points
+        order = self._order
+        dimensions = self.dimensions
+        found: list[int] = []
+        stack = [(0, len(order), 0)]
+        while stack:
+            lo, hi, depth = stack.pop()
+            if hi - lo <= _LEAF_SIZE:
+                for index in order[lo:hi]:
+                    if sum((a - b) * (a - b) for a, b in zip(points[index], coordinates)) <= limit:
+                        found.append(index)
+                continue
+            mid = (lo + hi) >> 1
+            index = order[mid]
+            point = points[index]
+            if sum((a - b) * (a - b) for a, b in zip(point, coordinates)) <= limit:
+                found.append(index)
+            axis = depth % dimensions
+            diff = coordinates[axis] - point[axis]
+            if diff <= 0 or diff * diff <= limit:
+                stack.append((lo, mid, depth + 1))
+            if diff >= 0 or diff * diff <= limit:
+                stack.append((mid + 1, hi, depth + 1))
+        found.sort()
+        return found
+
+    def closest_pairs(self, batch: int = 8) -> Iterator[tuple[int, int, int]]:
+        return closest_pairs(self, batch)
+
+    def _build(self, lo: int, hi: int, depth: int) -> None:
+        if hi - lo <= _LEAF_SIZE:
+            return
+        axis = depth % self.dimensions
+        points = self.points
+        self._order[lo:hi] = sorted(self._order[lo:hi], key=lambda index: points[index][axis])
+        mid = (lo + hi) >> 1
+        self._build(lo, mid, depth + 1)
+        self._build(mid + 1, hi, depth + 1)
+
+
+def closest_pairs(tree: KDTree, batch: int = 8) -> Iterator[tuple[int, int, int]]:
+    # Yields (distance_squared, i, j) with i < j in ascending (distance, i, j) order, lazily.
+    # Each point keeps a sorted batch of its nearest higher-index neighbours; the heap holds
+    # the next candidate of every point, and a point's batch is re-queried with double the
+    # size only when it runs out. Setup holds n * batch pairs; after yielding m pairs the
+    # batches total at most n * batch + 2m, so memory stays O(n * batch + m).
+    count = len(tree)
+    neighbours: list[list[tuple[int, int]]] = [[] for _ in range(count)]
+    sizes = [0] * count
+    positions = [0] * count
+    heap: list[tuple[int, int, int]] = []
+
+    def advance(index: int) -> None:
+        position = positions[index]
+        while True:
+            candidates = neighbours[index]
+            if position < len(candidates):
+                distance, other = candidates[position]
+                positions[index] = position + 1
+                heapq.heappush(heap, (distance, index, other))
+                return
+            available = count - 1 - index
+            if sizes[index] >= available:
+                neighbours[index] = []
+                return
+            sizes[index] = min(available, max(batch, sizes[index] * 2))
+            neighbours[index] = tree.k_nearest(
+                tree.points[index], sizes[index], min_index=index + 1
+            )
+
+    for index in range(count):
+        advance(index)
+    while heap:
+        distance, index, other = heapq.heappop(heap)
+        yield distance, index, other
+        advance(index)
+
+
+__all__ = ["KDTree", "PointN", "closest_pairs", "parse_point"]
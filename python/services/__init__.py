@@ -1,5 +1,16 @@
-from .file_loader import FileLoader, IFileLoader
+from .caching_file_loader import CachingFileLoader
+from .file_loader import FileLoader, IFileLoader, SingleFileLoader
+from .schema import Schema, SectionKind, Sections, compile_schema
 from .solution_runner import SolutionRunner
 
-__all__ = ["FileLoader", "IFileLoader", "SolutionRunner"]
-
+__all__ = [
+    "CachingFileLoader",
+    "FileLoader",
+    "IFileLoader",
+    "Schema",
+    "SectionKind",
+    "Sections",
+    "SingleFileLoader",
+    "SolutionRunner",
+    "compile_schema",
+]
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import ast
+import hashlib
+import sqlite3
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from models import SolutionType
+from solutions import ISolution
+
+PYTHON_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_STORE_PATH = PYTHON_ROOT / ".cache" / "answers.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    day INTEGER NOT NULL,
+    part INTEGER NOT NULL,
+    run_type TEXT NOT NULL,
+    source_hash TEXT NOT NULL,
+    input_hash TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    recorded_at REAL NOT NULL,
+    PRIMARY KEY (day, part, run_type, source_hash, input_hash)
+)
+"""
+
+
+@dataclass(frozen=True)
+class AnswerKey:
+    day: int
+    part: int
+    run_type: str
+    source_hash: str
+    input_hash: str
+
+
+@dataclass(frozen=True)
+class StoredAnswer:
+    answer: str
+    seconds: float
+    recorded_at: float
+
+
+class SourceFingerprint:
+    # Hashes a module together with every local module it can reach through imports, found
+    # by parsing source rather than importing. "Local" means a top-level package in the
+    # python root (models, services, helpers, solutions) or the solution's own top-level
+    # package, so stdlib and third-party code never enter the hash. Any import anywhere in
+    # a file counts, including ones inside functions or TYPE_CHECKING blocks.
+    def __init__(self, root: Path = PYTHON_ROOT) -> None:
+        self._root = root
+        self._bases: dict[str, Path | None] = {}
+        self._imports: dict[str, list[str]] = {}
+        self._contents: dict[str, bytes] = {}
+        self._digests: dict[str, str] = {}
+
+    def digest(self, module: str) -> str:
+        digest = self._digests.get(module)
+        if digest is None:
+            self._track(module.partition(".")[0])
+            hasher = hashlib.sha256()
+            for name in sorted(self.modules(module)):
+                hasher.update(name.encode("utf-8") + b"\0")
+                hasher.update(self._contents[name] + b"\0")
+            digest = self._digests[module] = hasher.hexdigest()
+        return digest
+
+    def modules(self, module: str) -> set[str]:
+        found: set[str] = set()
+        pending = [module]
+        while pending:
+            name = pending.pop()
+            if name in found:
+                continue
+            # Importing a.b.c also executes a/__init__.py and a/b/__init__.py.
+            parts = name.split(".")
+            pending.extend(".".join(parts[:end]) for end in range(1, len(parts)))
+            path = self._locate(name)
+            if path is None:
+                continue
+            found.add(name)
+            pending.extend(self._imported_names(name, path))
+        return found
+
+    def _track(self, top: str) -> None:
+        if self._bases.get(top) is not None:
+            return
+        module = sys.modules.get(top)
+        file = getattr(module, "__file__", None)
+        if file is None:
+            self._bases[top] = None
+            return
+        path = Path(file).resolve()
+        self._bases[top] = path.parent.parent if path.name == "__init__.py" else path.parent
+
+    def _base(self, top: str) -> Path | None:
+        if top not in self._bases:
+            local = (self._root / top).is_dir() or (self._root / f"{top}.py").is_file()
+            self._bases[top] = self._root if local else None
+        return self._bases[top]
+
+    def _locate(self, module: str) -> Path | None:
+        base = self._base(module.partition(".")[0])
+        if base is None:
+            return None
+        candidate = base.joinpath(*module.split("."))
+        if (candidate / "__init__.py").is_file():
+            return candidate / "__init__.py"
+        if candidate.with_suffix(".py").is_file():
+            return candidate.with_suffix(".py")
+        return None
+
+    def _imported_names(self, module: str, path: Path) -> list[str]:
+        names = self._imports.get(module)
+        if names is not None:
+            return names
+        source = path.read_bytes()
+        self._contents[module] = source
+        package = module if path.name == "__init__.py" else module.rpartition(".")[0]
+        names = []
+        for node in ast.walk(ast.parse(source, filename=str(path))):
+            if isinstance(node, ast.Import):
+                names.extend(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom):
+                if node.level:
+                    anchor = package.rsplit(".", node.level - 1)[0] if node.level > 1 else package
+                    base = f"{anchor}.{node.module}" if node.module else anchor
+                elif node.module:
+                    base = node.module
+                else:
+                    continue
+                names.append(base)
+                # `from package import name` may name a submodule rather than an attribute.
+                names.extend(f"{base}.{alias.name}" for alias in node.names if alias.name != "*")
+        self._imports[module] = names
+        return names
+
+
+class AnswerStore:
+    # Answers for a day and part are reused while the solution's source closure and the
+    # input file bytes are unchanged; the stored timing is the one measured when the answer
+    # was computed. Old rows are kept, so switching back to an earlier revision hits again.
+    def __init__(self, path: Path = DEFAULT_STORE_PATH, root: Path = PYTHON_ROOT) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(_SCHEMA)
+        self._root = root
+        self._fingerprint = SourceFingerprint(root)
+        self._input_hashes: dict[tuple[Path, int, int], str] = {}
+
+    def rescan(self) -> None:
+        # Source digests are cached per scan; call before each batch so edits made while the
+        # store stays open (the daemon, repeated run_all calls) are seen.
+        self._fingerprint = SourceFingerprint(self._root)
+
+    def key(self, solution: ISolution) -> AnswerKey | None:
+        # None when the input file cannot be read; such a solve is never stored.
+        options = solution.current_options
+        try:
+            path = solution.file_loader.data_file_path(
+                options.day, options.solution_type, options.run_type
+            )
+            input_hash = self._input_hash(path)
+        except OSError:
+            return None
+        return AnswerKey(
+            options.day,
+            1 if options.solution_type == SolutionType.FIRST else 2,
+            options.run_type.value,
+            self._fingerprint.digest(type(solution).__module__),
+            input_hash,
+        )
+
+    def get(self, key: AnswerKey) -> StoredAnswer | None:
+        row = self._connection.execute(
+            "SELECT answer, seconds, recorded_at FROM answers WHERE day = ? AND part = ? "
+            "AND run_type = ? AND source_hash = ? AND input_hash = ?",
+            (key.day, key.part, key.run_type, key.source_hash, key.input_hash),
+        ).fetchone()
+        return StoredAnswer(*row) if row else None
+
+    def put(self, key: AnswerKey, answer: str, seconds: float) -> None:
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key.day,
+                    key.part,
+                    key.run_type,
+                    key.source_hash,
+                    key.input_hash,
+                    answer,
+                    seconds,
+                    time.time(),
+                ),
+            )
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> "AnswerStore":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _input_hash(self, path: Path) -> str:
+        # Keyed like CachingFileLoader, so an edited input is hashed again.
+        stat = path.stat()
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        digest = self._input_hashes.get(key)
+        if digest is None:
+            digest = self._input_hashes[key] = hashlib.sha256(path.read_bytes()).hexdigest()
+        return digest
+
+
+__all__ = [
+    "DEFAULT_STORE_PATH",
+    "AnswerKey",
+    "AnswerStore",
+    "SourceFingerprint",
+    "StoredAnswer",
+]
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import json
+import math
+import statistics
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Iterable, Mapping
+
+from models import SolutionType
+from solutions import ISolution
+
+from .timing_file_loader import TimingFileLoader
+
+
+@dataclass(frozen=True)
+class TimingStats:
+    min: float
+    median: float
+    p95: float
+
+    @staticmethod
+    def from_samples(samples: list[float]) -> "TimingStats":
+        ordered = sorted(samples)
+        rank = max(1, math.ceil(0.95 * len(ordered)))
+        return TimingStats(ordered[0], statistics.median(ordered), ordered[rank - 1])
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    day: int
+    part: int
+    run_type: str
+    iterations: int
+    answer: str
+    wall: TimingStats
+    parse: TimingStats
+    solve: TimingStats
+    peak_memory_bytes: int
+
+    @property
+    def key(self) -> str:
+        return f"day{self.day:02d}-part{self.part}-{self.run_type.lower()}"
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class Regression:
+    key: str
+    baseline_seconds: float
+    current_seconds: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_seconds / self.baseline_seconds
+
+
+class Benchmark:
+    def __init__(self, iterations: int = 10, warmup: int = 2) -> None:
+        if iterations < 1:
+            raise ValueError("Benchmark needs at least one measured iteration.")
+        self._iterations = iterations
+        self._warmup = max(0, warmup)
+
+    def measure(self, solution: ISolution) -> BenchmarkResult:
+        loader = TimingFileLoader(solution.file_loader)
+        timed = solution.with_options(solution.current_options, loader)
+        options = timed.current_options
+
+        for _ in range(self._warmup):
+            timed.solve()
+
+        walls: list[float] = []
+        parses: list[float] = []
+        answer = ""
+        for _ in range(self._iterations):
+            loader.reset()
+            started = perf_counter()
+            answer = timed.solve()
+            walls.append(perf_counter() - started)
+            parses.append(loader.elapsed)
+
+        # tracemalloc slows allocation-heavy code down, so memory gets its own untimed run.
+        tracemalloc.start()
+        try:
+            timed.solve()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        return BenchmarkResult(
+            day=options.day,
+            part=1 if options.solution_type == SolutionType.FIRST else 2,
+            run_type=options.run_type.value,
+            iterations=self._iterations,
+            answer=answer,
+            wall=TimingStats.from_samples(walls),
+            parse=TimingStats.from_samples(parses),
+            solve=TimingStats.from_samples([wall - parse for wall, parse in zip(walls, parses)]),
+            peak_memory_bytes=peak,
+        )
+
+
+def find_regressions(
+    results: Iterable[BenchmarkResult], baseline: Mapping[str, Any], threshold: float
+) -> list[Regression]:
+    previous = {entry["key"]: entry for entry in baseline.get("results", [])}
+    regressions: list[Regression] = []
+    for result in results:
+        entry = previous.get(result.key)
+        if entry is None:
+            continue
+        baseline_seconds = entry["wall"]["median"]
+        if baseline_seconds > 0 and result.wall.median > baseline_seconds * (1 + threshold):
+            regressions.append(Regression(result.key, baseline_seconds, result.wall.median))
+    return regressions
+
+
+def write_report(results: Iterable[BenchmarkResult], path: Path) -> None:
+    payload = {"results": [dict(result.to_dict(), key=result.key) for result in results]}
+    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+def load_report(path: Path) -> dict[str, Any]:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def format_result(result: BenchmarkResult) -> str:
+    def milliseconds(stats: TimingStats) -> str:
+        return f"{stats.min * 1e3:.2f}/{stats.median * 1e3:.2f}/{stats.p95 * 1e3:.2f} ms"
+
+    return (
+        f"Day: {result.day}, Solution {result.part}: {result.answer} | "
+        f"wall {milliseconds(result.wall)} | parse {milliseconds(result.parse)} | "
+        f"solve {milliseconds(result.solve)} | peak {result.peak_memory_bytes / 1024:.1f} KiB"
+    )
+
+
+__all__ = [
+    "Benchmark",
+    "BenchmarkResult",
+    "Regression",
+    "TimingStats",
+    "find_regressions",
+    "format_result",
+    "load_report",
+    "write_report",
+]
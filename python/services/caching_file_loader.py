@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+from pathlib import Path
+from types import BuiltinFunctionType, CodeType, MethodDescriptorType
+from typing import Any, Callable, Hashable, Iterator, TypeVar
+
+from models import Grid, RunType, SolutionType
+
+from . import file_loader, parsers
+from .file_loader import IFileLoader
+
+T = TypeVar("T")
+
+CACHE_FORMAT_VERSION = 1
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "inputs"
+
+
+def _code_fingerprint(code: CodeType) -> str:
+    # Bytecode, names and constants, recursing into nested code objects whose repr would
+    # otherwise include a memory address.
+    digest = hashlib.sha256(code.co_code)
+    digest.update(repr(code.co_names).encode("utf-8"))
+    for constant in code.co_consts:
+        if isinstance(constant, CodeType):
+            digest.update(_code_fingerprint(constant).encode("ascii"))
+        else:
+            digest.update(repr(constant).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+@functools.lru_cache(maxsize=None)
+def _default_parser_fingerprint() -> str:
+    # Default parsing is FileLoader's splitting plus services/parsers.py, so their source
+    # stands in for a converter's code.
+    digest = hashlib.sha256()
+    for module in (file_loader, parsers):
+        digest.update(Path(module.__file__).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _converter_key(converter: Callable[[str], Any] | None) -> tuple[Hashable, str, bool]:
+    # Returns (key, code fingerprint, persistable). The default parser and named functions
+    # persist with a fingerprint of their code, so editing either invalidates their disk
+    # entries. Builtins (int, str.split, ...) persist under their name alone.
+    # Lambdas, nested functions and other callables are only cached in memory under their
+    # identity.
+    if converter is None:
+        return "default", _default_parser_fingerprint(), True
+    qualname = getattr(converter, "__qualname__", None)
+    module = getattr(converter, "__module__", None)
+    if not qualname or "<" in qualname:
+        return converter, "", False
+    code = getattr(converter, "__code__", None)
+    if isinstance(code, CodeType):
+        return f"{module}.{qualname}", _code_fingerprint(code), True
+    if module == "builtins" or isinstance(converter, (BuiltinFunctionType, MethodDescriptorType)):
+        return f"{module}.{qualname}", "", True
+    return converter, "", False
+
+
+class CachingFileLoader(IFileLoader):
+    def __init__(
+        self,
+        inner: IFileLoader,
+        cache_dir: Path | None = DEFAULT_CACHE_DIR,
+        max_entries: int = 32,
+    ) -> None:
+        self._inner = inner
+        self._cache_dir = cache_dir
+        self._max_entries = max_entries
+        self._memory: OrderedDict[tuple, bytes] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def data_file_path(self, day: int, solution_type: SolutionType, run_type: RunType) -> Path:
+        return self._inner.data_file_path(day, solution_type, run_type)
+
+    def load_raw(self, day: int, solution_type: SolutionType, run_type: RunType) -> str:
+        return self._cached(
+            "raw",
+            day,
+            solution_type,
+            run_type,
+            None,
+            lambda: self._inner.load_raw(day, solution_type, run_type),
+        )
+
+    def load_parsed(
+        self,
+        day: int,
+        solution_type: SolutionType,
+        run_type: RunType,
+        parser: Callable[[str], T],
+    ) -> T:
+        # Whole-text parsers such as Schema.parse depend on state (the schema spec) that a
+        # converter key cannot see, so only the raw text is cached.
+        return parser(self.load_raw(day, solution_type, run_type))
+
+    def load_lines(
+        self,
+        day: int,
+        solution_type: SolutionType,
+        run_type: RunType,
+        converter: Callable[[str], T] | None = None,
+    ) -> list[T]:
+        return self._cached(
+            "lines",
+            day,
+            solution_type,
+            run_type,
+            converter,
+            lambda: self._inner.load_lines(day, solution_type, run_type, converter),
+        )
+
+    def load_grid(
+        self,
+        day: int,
+        solution_type: SolutionType,
+        run_type: RunType,
+        converter: Callable[[str], T] | None = None,
+    ) -> Grid[T]:
+        return self._cached(
+            "grid",
+            day,
+            solution_type,
+            run_type,
+            converter,
+            lambda: self._inner.load_grid(day, solution_type, run_type, converter),
+        )
+
+    def load_items(
+        self,
+        day: int,
+        solution_type: SolutionType,
+        run_type: RunType,
+        converter: Callable[[str], T] | None = None,
+    ) -> list[list[T]]:
+        return self._cached(
+            "items",
+            day,
+            solution_type,
+            run_type,
+            converter,
+            lambda: self._inner.load_items(day, solution_type, run_type, converter),
+        )
+
+    def load_columns(
+        self,
+        day: int,
+        solution_type: SolutionType,
+        run_type: RunType,
+        converter: Callable[[str], T] | None = None,
+    ) -> list[Any]:
+        return self._cached(
+            "columns",
+            day,
+            solution_type,
+            run_type,
+            converter,
+            lambda: self._inner.load_columns(day, solution_type, run_type, converter),
+        )
+
+    def iter_lines(
+        self,
+        day: int,
+        solution_type: SolutionType,
+        run_type: RunType,
+        converter: Callable[[str], T] | None = None,
+    ) -> Iterator[T]:
+        return self._inner.iter_lines(day, solution_type, run_type, converter)
+
+    def iter_items(
+        self,
+        day: int,
+        solution_type: SolutionType,
+        run_type: RunType,
+        converter: Callable[[str], T] | None = None,
+    ) -> Iterator[list[T]]:
+        return self._inner.iter_items(day, solution_type, run_type, converter)
+
+    def iter_grid_rows(
+        self,
+        day: int,
+        solution_type: SolutionType,
+        run_type: RunType,
+        converter: Callable[[str], T] | None = None,
+    ) -> Iterator[list[T]]:
+        return self._inner.iter_grid_rows(day, solution_type, run_type, converter)
+
+    def clear(self) -> None:
+        self._memory.clear()
+
+    def _cached(
+        self,
+        kind: str,
+        day: int,
+        solution_type: SolutionType,
+        run_type: RunType,
+        converter: Callable[[str], Any] | None,
+        load: Callable[[], T],
+    ) -> T:
+        path = self._inner.data_file_path(day, solution_type, run_type)
+        try:
+            stat = path.stat()
+        except OSError:
+            return load()
+
+        converter_key, fingerprint, persistable = _converter_key(converter)
+        identity = (str(path.resolve()), kind, converter_key, CACHE_FORMAT_VERSION)
+        key = identity + (fingerprint, stat.st_mtime_ns, stat.st_size)
+
+        # Entries are stored pickled so callers can mutate what they get back.
+        payload = self._memory.get(key)
+        if payload is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return pickle.loads(payload)
+
+        disk_path = self._disk_path(identity, key) if persistable else None
+        if disk_path is not None and disk_path.exists():
+            try:
+                payload = disk_path.read_bytes()
+                result = pickle.loads(payload)
+            except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+                # A truncated or outdated entry is a miss; it is overwritten below.
+                pass
+            else:
+                self._remember(key, payload)
+                self.hits += 1
+                return result
+
+        self.misses += 1
+        result = load()
+        payload = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        self._remember(key, payload)
+        if disk_path is not None:
+            self._persist(disk_path, payload)
+        return result
+
+    def _remember(self, key: tuple, payload: bytes) -> None:
+        self._memory[key] = payload
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_path(self, identity: tuple, key: tuple) -> Path | None:
+        if self._cache_dir is None:
+            return None
+        prefix = hashlib.sha256(repr(identity).encode("utf-8")).hexdigest()[:16]
+        version = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()[:16]
+        return self._cache_dir / f"{prefix}-{version}.pickle"
+
+    @staticmethod
+    def _persist(disk_path: Path, payload: bytes) -> None:
+        try:
+            disk_path.parent.mkdir(parents=True, exist_ok=True)
+            prefix = disk_path.name.split("-", 1)[0]
+            for stale in disk_path.parent.glob(f"{prefix}-*.pickle"):
+                stale.unlink(missing_ok=True)
+            temporary = disk_path.with_suffix(f".{os.getpid()}.tmp")
+            temporary.write_bytes(payload)
+            os.replace(temporary, disk_path)
+        except OSError:
+            # The on-disk cache is an optimisation; a read-only checkout still works.
+            pass
+
+
+__all__ = ["CACHE_FORMAT_VERSION", "CachingFileLoader", "DEFAULT_CACHE_DIR"]
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import glob
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Iterable, Iterator
+
+from models import SolutionOptions, SolutionType
+from solutions import ISolution, SolutionRegistry
+
+from .file_loader import SingleFileLoader
+
+DEFAULT_CORPUS_DIR = Path(__file__).resolve().parent.parent / ".cache" / "corpus"
+
+_PART_TYPES = {1: SolutionType.FIRST, 2: SolutionType.SECOND}
+
+# Set once per worker process by _initialise_worker, so the solution class is imported a
+# single time per worker rather than once per input.
+_worker_class: type[ISolution] | None = None
+_worker_options: SolutionOptions | None = None
+
+
+@dataclass(frozen=True)
+class CorpusResult:
+    file: str
+    part: int
+    answer: str | None
+    seconds: float
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def resolve_corpus(source: str) -> list[Path]:
+    # A directory means every regular, non-hidden file directly inside it; anything else is
+    # treated as a glob pattern (recursive ** allowed).
+    path = Path(source)
+    if path.is_dir():
+        files = [
+            item for item in path.iterdir() if item.is_file() and not item.name.startswith(".")
+        ]
+    else:
+        files = [Path(match) for match in glob.glob(source, recursive=True)]
+        files = [item for item in files if item.is_file()]
+    return sorted(files)
+
+
+def completed_files(output: Path, parts: Iterable[int] = (1, 2)) -> set[str]:
+    # Files with a record for every requested part. A torn final line from an interrupted run
+    # is ignored, so that file is simply run again.
+    recorded: dict[str, set[int]] = {}
+    if not output.exists():
+        return set()
+    with output.open(encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(record, dict) and "file" in record:
+                recorded.setdefault(record["file"], set()).add(record.get("part"))
+    required = set(parts)
+    return {file for file, seen in recorded.items() if required <= seen}
+
+
+def _trim_incomplete_tail(output: Path, parts: Iterable[int]) -> None:
+    # Records for one input are written together, so only the tail can hold a torn line or a
+    # partly written input. Dropping it avoids duplicates when that input is run again.
+    if not output.exists():
+        return
+    done = completed_files(output, parts)
+    with output.open("rb+") as handle:
+        lines = handle.read().split(b"\n")
+        keep = len(lines)
+        while keep:
+            line = lines[keep - 1]
+            if line:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    record = None
+                if isinstance(record, dict) and record.get("file") in done:
+                    break
+            keep -= 1
+        size = sum(len(line) + 1 for line in lines[:keep])
+        handle.truncate(size)
+
+
+def _initialise_worker(registry: SolutionRegistry, day: int, options: SolutionOptions) -> None:
+    global _worker_class, _worker_options
+    _worker_class = registry.solution_class(day)
+    _worker_options = options
+
+
+def _solve_file(job: tuple[str, tuple[int, ...]]) -> list[CorpusResult]:
+    file_name, parts = job
+    loader = SingleFileLoader(Path(file_name))
+    results: list[CorpusResult] = []
+    for part in parts:
+        assert _worker_class is not None and _worker_options is not None
+        options = _worker_options.copy_with(solution_type=_PART_TYPES[part])
+        solution = _worker_class(loader, options)  # type: ignore[call-arg]
+        started = perf_counter()
+        try:
+            answer = solution.solve()
+        except Exception as error:  # noqa: BLE001 - one bad input must not stop the corpus
+            seconds = perf_counter() - started
+            results.append(
+                CorpusResult(file_name, part, None, seconds, f"{type(error).__name__}: {error}")
+            )
+            continue
+        results.append(CorpusResult(file_name, part, str(answer), perf_counter() - started))
+    return results
+
+
+class CorpusRun:
+    def __init__(
+        self,
+        registry: SolutionRegistry,
+        options: SolutionOptions,
+        parts: tuple[int, ...] = (1, 2),
+        workers: int = 1,
+    ) -> None:
+        self._registry = registry
+        self._options = options
+        self._parts = parts
+        self._workers = workers
+
+    def run(
+        self, files: Iterable[Path], output: Path, resume: bool = False
+    ) -> Iterator[CorpusResult]:
+        # Results are appended and flushed one input at a time, in input order, so an
+        # interrupted run can be resumed from the last completed file.
+        if self._registry.solution_class(self._options.day) is None:
+            raise LookupError(f"Solution for day {self._options.day} not found.")
+
+        skip: set[str] = set()
+        if resume:
+            _trim_incomplete_tail(output, self._parts)
+            skip = completed_files(output, self._parts)
+        jobs = [(str(path), self._parts) for path in files if str(path) not in skip]
+        output.parent.mkdir(parents=True, exist_ok=True)
+        initargs = (self._registry, self._options.day, self._options)
+
+        with output.open("a" if resume else "w", encoding="utf-8") as handle:
+            for results in self._map(jobs, initargs):
+                for result in results:
+                    handle.write(json.dumps(result.to_dict()) + "\n")
+                handle.flush()
+                yield from results
+
+    def _map(
+        self, jobs: list[tuple[str, tuple[int, ...]]], initargs: tuple
+    ) -> Iterator[list[CorpusResult]]:
+        if self._workers == 1:
+            _initialise_worker(*initargs)
+            yield from map(_solve_file, jobs)
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = self._workers if self._workers > 0 else os.cpu_count() or 1
+        # Small chunks keep workers busy without letting one slow input hold back a big batch.
+        chunksize = max(1, min(16, len(jobs) // (workers * 4)))
+        with ProcessPoolExecutor(
+            workers, initializer=_initialise_worker, initargs=initargs
+        ) as pool:
+            yield from pool.map(_solve_file, jobs, chunksize=chunksize)
+
+
+__all__ = [
+    "CorpusResult",
+    "CorpusRun",
+    "DEFAULT_CORPUS_DIR",
+    "completed_files",
+    "resolve_corpus",
+]
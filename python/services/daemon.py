@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import tempfile
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from models import RunType, SolutionOptions, SolutionType
+from solutions import SolutionRegistry
+
+from .caching_file_loader import CachingFileLoader
+from .file_loader import FileLoader, IFileLoader, SingleFileLoader
+
+DEFAULT_SOCKET_PATH = Path(__file__).resolve().parent.parent / ".cache" / "solver.sock"
+DEFAULT_HOST = "127.0.0.1"
+
+# Inline inputs travel inside a single JSON line, so the stream limit has to fit a full input.
+_LINE_LIMIT = 64 * 1024 * 1024
+_PART_TYPES = {1: SolutionType.FIRST, 2: SolutionType.SECOND}
+
+# Per-worker warm state: every solution class imported once and an in-memory input cache
+# that survives between requests (it still re-reads a file when its contents change).
+_worker_registry: SolutionRegistry | None = None
+_worker_loader: IFileLoader | None = None
+_worker_options: SolutionOptions | None = None
+
+
+def _warm_worker(registry: SolutionRegistry, options: SolutionOptions) -> None:
+    global _worker_registry, _worker_loader, _worker_options
+    for day in registry.days():
+        registry.solution_class(day)
+    _worker_registry = registry
+    _worker_loader = CachingFileLoader(FileLoader(), cache_dir=None)
+    _worker_options = options
+
+
+def _parse_request(request: dict[str, Any], defaults: SolutionOptions) -> SolutionOptions:
+    day = request.get("day", defaults.day)
+    if isinstance(day, bool) or not isinstance(day, int):
+        raise ValueError(f"Day must be an integer: {day!r}")
+    part = request.get("part", 1 if defaults.solution_type == SolutionType.FIRST else 2)
+    if part not in _PART_TYPES:
+        raise ValueError(f"Unknown part: {part!r}")
+    run_type = defaults.run_type
+    if "runType" in request:
+        names = {member.value.lower(): member for member in RunType}
+        run_type = names.get(str(request["runType"]).lower())
+        if run_type is None:
+            raise ValueError(f"Unknown run type: {request['runType']!r}")
+    return defaults.copy_with(day=day, solution_type=_PART_TYPES[part], run_type=run_type)
+
+
+def _solve_request(request: dict[str, Any]) -> dict[str, Any]:
+    assert _worker_registry is not None and _worker_options is not None
+    options = _parse_request(request, _worker_options)
+    part = 1 if options.solution_type == SolutionType.FIRST else 2
+    response: dict[str, Any] = {"day": options.day, "part": part}
+
+    inline = request.get("input")
+    temporary: Path | None = None
+    loader = _worker_loader
+    if inline is not None:
+        handle, name = tempfile.mkstemp(prefix=f"day{options.day:02d}-", suffix=".txt")
+        with os.fdopen(handle, "w", encoding="utf-8") as stream:
+            stream.write(inline)
+        temporary = Path(name)
+        loader = SingleFileLoader(temporary)
+    else:
+        response["runType"] = options.run_type.value
+
+    try:
+        solution = _worker_registry.create(options.day, loader, options)  # type: ignore[arg-type]
+        if solution is None:
+            return {**response, "ok": False, "error": f"Solution for day {options.day} not found."}
+        started = perf_counter()
+        answer = solution.solve()
+        return {**response, "ok": True, "answer": str(answer), "seconds": perf_counter() - started}
+    finally:
+        if temporary is not None:
+            temporary.unlink(missing_ok=True)
+
+
+class SolverDaemon:
+    # JSON Lines over a Unix socket (or localhost TCP). Each request line is answered by one
+    # response line. Solves run in a warm process pool so the event loop keeps serving.
+    #   {"day": 8, "part": 2, "runType": "Full"}      configured input files
+    #   {"day": 8, "part": 1, "input": "..."}         inline input text
+    #   {"command": "ping"} / {"command": "shutdown"}
+    def __init__(
+        self, registry: SolutionRegistry, options: SolutionOptions, workers: int = 1
+    ) -> None:
+        self._registry = registry
+        self._options = options
+        self._workers = workers if workers > 0 else os.cpu_count() or 1
+        self._stopping: asyncio.Event | None = None
+        self._pool: Any = None
+
+    async def serve(
+        self, socket_path: Path | None = DEFAULT_SOCKET_PATH, port: int | None = None
+    ) -> None:
+        from concurrent.futures import ProcessPoolExecutor
+
+        self._stopping = asyncio.Event()
+        with ProcessPoolExecutor(
+            self._workers, initializer=_warm_worker, initargs=(self._registry, self._options)
+        ) as pool:
+            self._pool = pool
+            # Every worker is warmed before the first request arrives.
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(
+                *(loop.run_in_executor(pool, os.getpid) for _ in range(self._workers))
+            )
+            if port is not None:
+                server = await asyncio.start_server(
+                    self._handle, DEFAULT_HOST, port, limit=_LINE_LIMIT
+                )
+                address = f"{DEFAULT_HOST}:{port}"
+            else:
+                assert socket_path is not None
+                socket_path.parent.mkdir(parents=True, exist_ok=True)
+                socket_path.unlink(missing_ok=True)
+                server = await asyncio.start_unix_server(
+                    self._handle, str(socket_path), limit=_LINE_LIMIT
+                )
+                address = str(socket_path)
+            print(f"Serving {len(self._registry.days())} days on {address}", flush=True)
+            try:
+                async with server:
+                    await self._stopping.wait()
+            finally:
+                if port is None and socket_path is not None:
+                    socket_path.unlink(missing_ok=True)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while line := await reader.readline():
+                if not line.strip():
+                    continue
+                response = await self._respond(line)
+                writer.write(json.dumps(response).encode("utf-8") + b"\n")
+                await writer.drain()
+                if response.get("command") == "shutdown":
+                    break
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, line: bytes) -> dict[str, Any]:
+        started = perf_counter()
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("Request must be a JSON object.")
+            command = request.get("command")
+            if command == "ping":
+                return {"ok": True, "command": command, "days": self._registry.days()}
+            if command == "shutdown":
+                assert self._stopping is not None
+                self._stopping.set()
+                return {"ok": True, "command": command}
+            if command is not None:
+                raise ValueError(f"Unknown command: {command!r}")
+            _parse_request(request, self._options)
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(self._pool, _solve_request, request)
+        except Exception as error:  # noqa: BLE001 - report the failure to the client instead
+            response = {"ok": False, "error": f"{type(error).__name__}: {error}"}
+        response["elapsed"] = perf_counter() - started
+        return response
+
+
+def send_request(
+    request: dict[str, Any],
+    socket_path: Path | None = DEFAULT_SOCKET_PATH,
+    port: int | None = None,
+    timeout: float | None = None,
+) -> dict[str, Any]:
+    # A plain blocking client, so callers do not need an event loop.
+    if port is not None:
+        connection = socket.create_connection((DEFAULT_HOST, port), timeout=timeout)
+    else:
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.settimeout(timeout)
+        connection.connect(str(socket_path))
+    with connection, connection.makefile("rwb") as stream:
+        stream.write(json.dumps(request).encode("utf-8") + b"\n")
+        stream.flush()
+        reply = stream.readline()
+    if not reply:
+        raise ConnectionError("Solver daemon closed the connection without replying.")
+    return json.loads(reply)
+
+
+__all__ = [
+    "DEFAULT_HOST",
+    "DEFAULT_SOCKET_PATH",
+    "SolverDaemon",
+    "send_request",
+]
@@ -1,16 +1,30 @@
 from __future__ import annotations
 
+import mmap
+from array import array
 from pathlib import Path
-from typing import Callable, Iterable, List, Protocol, Sequence, TypeVar
+from typing import Callable, Iterable, Iterator, List, Protocol, Sequence, TypeVar
 
 from models import Grid, RunType, SolutionType
 
+from . import parsers
+
 T = TypeVar("T")
 
 
 class IFileLoader(Protocol):
+    def data_file_path(self, day: int, solution_type: SolutionType, run_type: RunType) -> Path: ...
+
     def load_raw(self, day: int, solution_type: SolutionType, run_type: RunType) -> str: ...
 
+    def load_parsed(
+        self,
+        day: int,
+        solution_type: SolutionType,
+        run_type: RunType,
+        parser: Callable[[str], T],
+    ) -> T: ...
+
     def load_lines(
         self,
         day: int,
@@ -35,6 +49,38 @@ class IFileLoader(Protocol):
         converter: Callable[[str], T] | None = None,
     ) -> list[list[T]]: ...
 
+    def load_columns(
+        self,
+        day: int,
+        solution_type: SolutionType,
+        run_type: RunType,
+        converter: Callable[[str], T] | None = None,
+    ) -> list[array | list[T]]: ...
+
+    def iter_lines(
+        self,
+        day: int,
+        solution_type: SolutionType,
+        run_type: RunType,
+        converter: Callable[[str], T] | None = None,
+    ) -> Iterator[T]: ...
+
+    def iter_items(
+        self,
+        day: int,
+        solution_type: SolutionType,
+        run_type: RunType,
+        converter: Callable[[str], T] | None = None,
+    ) -> Iterator[list[T]]: ...
+
+    def iter_grid_rows(
+        self,
+        day: int,
+        solution_type: SolutionType,
+        run_type: RunType,
+        converter: Callable[[str], T] | None = None,
+    ) -> Iterator[list[T]]: ...
+
 
 class FileLoader(IFileLoader):
     def __init__(self, solutions_root: Path | None = None) -> None:
@@ -53,10 +99,22 @@ class FileLoader(IFileLoader):
             root = next((candidate for candidate in candidates if candidate.exists()), candidates[0])
         self._solutions_root = root
 
+    def data_file_path(self, day: int, solution_type: SolutionType, run_type: RunType) -> Path:
+        return self._resolve_data_file_path(day, solution_type, run_type)
+
     def load_raw(self, day: int, solution_type: SolutionType, run_type: RunType) -> str:
         file_path = self._resolve_data_file_path(day, solution_type, run_type)
         return file_path.read_text(encoding="utf-8")
 
+    def load_parsed(
+        self,
+        day: int,
+        solution_type: SolutionType,
+        run_type: RunType,
+        parser: Callable[[str], T],
+    ) -> T:
+        return parser(self.load_raw(day, solution_type, run_type))
+
     def load_lines(
         self,
         day: int,
@@ -64,9 +122,10 @@ class FileLoader(IFileLoader):
         run_type: RunType,
         converter: Callable[[str], T] | None = None,
     ) -> list[T]:
-        converter = converter or self._default_converter
         raw = self.load_raw(day, solution_type, run_type)
         lines = [line.rstrip("\n") for line in raw.splitlines() if line.strip()]
+        if converter is None:
+            return parsers.convert_column([line.strip() for line in lines])
         return [converter(line) for line in lines]
 
     def load_grid(
@@ -76,8 +135,9 @@ class FileLoader(IFileLoader):
         run_type: RunType,
         converter: Callable[[str], T] | None = None,
     ) -> Grid[T]:
-        converter = converter or self._default_converter
         lines = self.load_lines(day, solution_type, run_type, lambda value: value)
+        if converter is None:
+            return Grid([parsers.parse_grid_line(line) for line in lines])
         rows: list[list[T]] = []
         for line in lines:
             row = [converter(char) for char in line if not char.isspace()]
@@ -91,7 +151,9 @@ class FileLoader(IFileLoader):
         run_type: RunType,
         converter: Callable[[str], T] | None = None,
     ) -> list[list[T]]:
-        converter = converter or self._default_converter
+        if converter is None:
+            raw = self.load_raw(day, solution_type, run_type)
+            return parsers.parse_rows(parsers.split_rows(raw.splitlines()))
         raw_lines = self.load_lines(day, solution_type, run_type, lambda value: value)
         result: list[list[T]] = []
         for line in raw_lines:
@@ -100,6 +162,77 @@ class FileLoader(IFileLoader):
                 result.append(entries)
         return result
 
+    def load_columns(
+        self,
+        day: int,
+        solution_type: SolutionType,
+        run_type: RunType,
+        converter: Callable[[str], T] | None = None,
+    ) -> list[array | list[T]]:
+        raw = self.load_raw(day, solution_type, run_type)
+        columns = parsers.split_columns(parsers.split_rows(raw.splitlines()))
+        if converter is None:
+            return [parsers.typed_column(column) for column in columns]
+        return [list(map(converter, column)) for column in columns]
+
+    def iter_lines(
+        self,
+        day: int,
+        solution_type: SolutionType,
+        run_type: RunType,
+        converter: Callable[[str], T] | None = None,
+    ) -> Iterator[T]:
+        converter = converter or self._default_converter
+        file_path = self._resolve_data_file_path(day, solution_type, run_type)
+        for line in self._iter_raw_lines(file_path):
+            yield converter(line.decode("utf-8"))
+
+    def iter_items(
+        self,
+        day: int,
+        solution_type: SolutionType,
+        run_type: RunType,
+        converter: Callable[[str], T] | None = None,
+    ) -> Iterator[list[T]]:
+        converter = converter or self._default_converter
+        file_path = self._resolve_data_file_path(day, solution_type, run_type)
+        for line in self._iter_raw_lines(file_path):
+            yield [converter(token.decode("utf-8")) for token in line.split()]
+
+    def iter_grid_rows(
+        self,
+        day: int,
+        solution_type: SolutionType,
+        run_type: RunType,
+        converter: Callable[[str], T] | None = None,
+    ) -> Iterator[list[T]]:
+        file_path = self._resolve_data_file_path(day, solution_type, run_type)
+        for line in self._iter_raw_lines(file_path):
+            if converter is None:
+                yield parsers.parse_grid_line(line.decode("utf-8"))
+            else:
+                yield [converter(char) for char in line.decode("utf-8") if not char.isspace()]
+
+    @staticmethod
+    def _iter_raw_lines(file_path: Path) -> Iterator[bytes]:
+        # Slices lines straight out of a memory map so only the current line is materialised.
+        with file_path.open("rb") as handle:
+            size = handle.seek(0, 2)
+            if size == 0:
+                return
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                start = 0
+                while start < size:
+                    end = mapped.find(b"\n", start)
+                    if end == -1:
+                        end = size
+                    line = mapped[start:end]
+                    start = end + 1
+                    if line.endswith(b"\r"):
+                        line = line[:-1]
+                    if line.strip():
+                        yield line
+
     def _resolve_data_file_path(
         self, day: int, solution_type: SolutionType, run_type: RunType
     ) -> Path:
@@ -115,17 +248,17 @@ class FileLoader(IFileLoader):
 
     @staticmethod
     def _default_converter(value: str) -> T:
-        stripped = value.strip()
-        if not stripped:
-            return stripped  # type: ignore[return-value]
-        if stripped.isdigit() or (stripped.startswith("-") and stripped[1:].isdigit()):
-            return int(stripped)  # type: ignore[return-value]
-        try:
-            return float(stripped)  # type: ignore[return-value]
-        except ValueError:
-            pass
-        lowered = stripped.lower()
-        if lowered in {"true", "false"}:
-            return (lowered == "true")  # type: ignore[return-value]
-        return stripped  # type: ignore[return-value]
+        return parsers.convert_token(value)  # type: ignore[return-value]
+
 
+class SingleFileLoader(FileLoader):
+    # Serves one fixed input file for every day, part and run type; used to run a solution
+    # against inputs that live outside DayNN/Data.
+    def __init__(self, file_path: Path) -> None:
+        super().__init__(file_path.parent)
+        self._file_path = file_path
+
+    def _resolve_data_file_path(
+        self, day: int, solution_type: SolutionType, run_type: RunType
+    ) -> Path:
+        return self._file_path
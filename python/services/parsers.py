@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import re
+from array import array
+from enum import Enum
+from itertools import chain
+from typing import Any, Iterable, Sequence
+
+_INT_COLUMN = re.compile(r"(?:-?\d+\n)*-?\d+").fullmatch
+_ANY_INT = re.compile(r"^-?\d+$", re.MULTILINE).search
+_BOOL_LITERALS = {"true": True, "false": False}
+_DIGIT_TABLE = bytes.maketrans(b"0123456789", bytes(range(10)))
+_GRID_CHAR_VALUES = {str(digit): digit for digit in range(10)}
+
+
+class ColumnType(str, Enum):
+    INT = "int"
+    FLOAT = "float"
+    BOOL = "bool"
+    STR = "str"
+
+
+def convert_token(value: str) -> Any:
+    stripped = value.strip()
+    if not stripped:
+        return stripped
+    if stripped.isdigit() or (stripped.startswith("-") and stripped[1:].isdigit()):
+        return int(stripped)
+    try:
+        return float(stripped)
+    except ValueError:
+        pass
+    lowered = stripped.lower()
+    if lowered in _BOOL_LITERALS:
+        return _BOOL_LITERALS[lowered]
+    return stripped
+
+
+def infer_column_type(tokens: Sequence[str]) -> ColumnType:
+    return _convert(tokens)[0]
+
+
+def convert_column(tokens: Sequence[str], column_type: ColumnType | None = None) -> list[Any]:
+    if column_type is None:
+        return _convert(tokens)[1]
+    if column_type == ColumnType.INT:
+        return list(map(int, tokens))
+    if column_type == ColumnType.FLOAT:
+        return list(map(float, tokens))
+    if column_type == ColumnType.BOOL:
+        return [_BOOL_LITERALS[token.lower()] for token in tokens]
+    return _convert_distinct(tokens)
+
+
+def _convert(tokens: Sequence[str]) -> tuple[ColumnType, list[Any]]:
+    # Tokens never contain newlines, so one regex pass over the joined column decides the type.
+    joined = "\n".join(tokens)
+    if not tokens or _INT_COLUMN(joined):
+        return ColumnType.INT, list(map(int, tokens))
+    if not _ANY_INT(joined):
+        try:
+            return ColumnType.FLOAT, list(map(float, tokens))
+        except ValueError:
+            pass
+    lowered = joined.lower()
+    if all(token in _BOOL_LITERALS for token in lowered.split("\n")):
+        return ColumnType.BOOL, [_BOOL_LITERALS[token] for token in lowered.split("\n")]
+    return ColumnType.STR, _convert_distinct(tokens)
+
+
+def _convert_distinct(tokens: Sequence[str]) -> list[Any]:
+    # Mixed or textual columns: convert each distinct token once.
+    converted = {token: convert_token(token) for token in set(tokens)}
+    return list(map(converted.__getitem__, tokens))
+
+
+def typed_column(tokens: Sequence[str]) -> array | list[Any]:
+    column_type, values = _convert(tokens)
+    if column_type == ColumnType.INT:
+        try:
+            return array("q", values)
+        except OverflowError:
+            return values
+    if column_type == ColumnType.FLOAT:
+        return array("d", values)
+    return values
+
+
+def split_rows(lines: Iterable[str]) -> list[list[str]]:
+    return [tokens for tokens in map(str.split, lines) if tokens]
+
+
+def split_columns(rows: Sequence[Sequence[str]]) -> list[list[str]]:
+    widths = set(map(len, rows))
+    if len(widths) == 1:
+        width = widths.pop()
+        flat = list(chain.from_iterable(rows))
+        return [flat[index::width] for index in range(width)]
+    width = max(widths, default=0)
+    return [[row[index] for row in rows if len(row) > index] for index in range(width)]
+
+
+def parse_rows(rows: Sequence[Sequence[str]]) -> list[list[Any]]:
+    columns = [convert_column(column) for column in split_columns(rows)]
+    if all(len(column) == len(rows) for column in columns):
+        return list(map(list, zip(*columns)))
+
+    cursors = [iter(column) for column in columns]
+    return [[next(cursors[index]) for index in range(len(row))] for row in rows]
+
+
+def parse_grid_line(line: str) -> list[Any]:
+    if line.isascii():
+        if line.isdigit():
+            return list(line.encode("ascii").translate(_DIGIT_TABLE))
+        lookup = _GRID_CHAR_VALUES.get
+        return [lookup(char, char) for char in line if not char.isspace()]
+    return [convert_token(char) for char in line if not char.isspace()]
+
+
+__all__ = [
+    "ColumnType",
+    "convert_column",
+    "convert_token",
+    "infer_column_type",
+    "parse_grid_line",
+    "parse_rows",
+    "split_columns",
+    "split_rows",
+    "typed_column",
+]
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import cProfile
+import sys
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from time import perf_counter
+from types import FrameType
+
+from models import SolutionType
+from solutions import ISolution
+
+from .timing_file_loader import TimingFileLoader
+
+DEFAULT_PROFILE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "profiles"
+
+
+class ProfilerKind(str, Enum):
+    NONE = "none"
+    CPROFILE = "cprofile"
+    SAMPLING = "sampling"
+    BOTH = "both"
+
+
+@dataclass
+class ProfileReport:
+    day: int
+    part: int
+    answer: str
+    spans: dict[str, float] = field(default_factory=dict)
+    files: list[Path] = field(default_factory=list)
+
+
+class SamplingProfiler:
+    def __init__(self, interval: float = 0.001) -> None:
+        self._interval = interval
+        self._samples: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._target_id = 0
+        self._root: FrameType | None = None
+
+    def start(self) -> None:
+        # Frames above the caller belong to the runner, not the solve, and are left out.
+        self._target_id = threading.get_ident()
+        self._root = sys._getframe(1)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._sample, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._root = None
+
+    def write_collapsed(self, path: Path) -> None:
+        lines = [f"{stack} {count}" for stack, count in sorted(self._samples.items())]
+        path.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self._interval):
+            frame = sys._current_frames().get(self._target_id)
+            names: list[str] = []
+            while frame is not None and frame is not self._root:
+                code = frame.f_code
+                names.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if names and not self._stop.is_set():
+                self._samples[";".join(reversed(names))] += 1
+
+
+class SolveProfiler:
+    def __init__(
+        self, kind: ProfilerKind = ProfilerKind.CPROFILE, output_dir: Path = DEFAULT_PROFILE_DIR
+    ) -> None:
+        self._kind = kind
+        self._output_dir = output_dir
+
+    def profile(self, solution: ISolution, config_seconds: float = 0.0) -> ProfileReport:
+        loader = TimingFileLoader(solution.file_loader)
+        timed = solution.with_options(solution.current_options, loader)
+        options = timed.current_options
+        part = 1 if options.solution_type == SolutionType.FIRST else 2
+        stem = f"day{options.day:02d}-part{part}-{options.run_type.value.lower()}"
+        report = ProfileReport(options.day, part, "")
+        if self._kind != ProfilerKind.NONE:
+            self._output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Spans come from an unprofiled solve; each profiler then gets a solve of its own, so
+        # neither cProfile's tracing nor the sampler skews the config/input/solve split.
+        started = perf_counter()
+        report.answer = timed.solve()
+        wall = perf_counter() - started
+        report.spans = {
+            "config": config_seconds,
+            "input": loader.elapsed,
+            "solve": wall - loader.elapsed,
+        }
+
+        if self._kind in {ProfilerKind.CPROFILE, ProfilerKind.BOTH}:
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                timed.solve()
+            finally:
+                profiler.disable()
+            path = self._output_dir / f"{stem}.pstats"
+            profiler.dump_stats(str(path))
+            report.files.append(path)
+
+        if self._kind in {ProfilerKind.SAMPLING, ProfilerKind.BOTH}:
+            sampler = SamplingProfiler()
+            sampler.start()
+            try:
+                timed.solve()
+            finally:
+                sampler.stop()
+            path = self._output_dir / f"{stem}.collapsed"
+            sampler.write_collapsed(path)
+            report.files.append(path)
+
+        return report
+
+
+def format_report(report: ProfileReport) -> str:
+    spans = " | ".join(f"{name} {seconds * 1e3:.2f} ms" for name, seconds in report.spans.items())
+    files = "".join(f"\n  -> {path}" for path in report.files)
+    return f"Day: {report.day}, Solution {report.part}: {report.answer} | {spans}{files}"
+
+
+__all__ = [
+    "DEFAULT_PROFILE_DIR",
+    "ProfileReport",
+    "ProfilerKind",
+    "SamplingProfiler",
+    "SolveProfiler",
+    "format_report",
+]
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import math
+import os
+import random
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+
+from helpers.generators import InputGenerator
+from models import SolutionType
+from solutions import ISolution
+
+from .file_loader import SingleFileLoader
+
+DEFAULT_SIZES = (1_000, 4_000, 16_000, 64_000)
+
+
+@dataclass(frozen=True)
+class ScalingPoint:
+    size: int
+    seconds: float
+    answer: str
+
+
+@dataclass
+class ScalingResult:
+    day: int
+    part: int
+    points: list[ScalingPoint] = field(default_factory=list)
+
+    @property
+    def exponent(self) -> float | None:
+        return fit_exponent([(point.size, point.seconds) for point in self.points])
+
+
+def fit_exponent(samples: list[tuple[int, float]]) -> float | None:
+    # Least-squares slope of log(seconds) against log(size): ~1 is linear, ~2 quadratic.
+    logs = [(math.log(size), math.log(seconds)) for size, seconds in samples if seconds > 0]
+    if len(logs) < 2:
+        return None
+    mean_x = sum(x for x, _ in logs) / len(logs)
+    mean_y = sum(y for _, y in logs) / len(logs)
+    spread = sum((x - mean_x) ** 2 for x, _ in logs)
+    if spread == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in logs) / spread
+
+
+class ScalingBenchmark:
+    def __init__(
+        self, sizes: tuple[int, ...] = DEFAULT_SIZES, repeats: int = 3, seed: int = 0
+    ) -> None:
+        if repeats < 1:
+            raise ValueError("Scaling benchmarks need at least one repeat per size.")
+        self._sizes = tuple(sorted(sizes))
+        self._repeats = repeats
+        self._seed = seed
+
+    def measure(self, solution: ISolution, generator: InputGenerator) -> ScalingResult:
+        # Each size gets its own seeded input, written to a temp file and solved through the
+        # normal loaders; the fastest of the repeats is kept to damp scheduler noise.
+        options = solution.current_options
+        part = 1 if options.solution_type == SolutionType.FIRST else 2
+        result = ScalingResult(options.day, part)
+        for size in self._sizes:
+            text = generator(size, random.Random(self._seed * 1_000_003 + size))
+            prefix = f"day{options.day:02d}-{size}-"
+            handle, name = tempfile.mkstemp(prefix=prefix, suffix=".txt")
+            path = Path(name)
+            try:
+                with os.fdopen(handle, "w", encoding="utf-8") as stream:
+                    stream.write(text)
+                job = solution.with_options(options, SingleFileLoader(path))
+                best = math.inf
+                answer = ""
+                for _ in range(self._repeats):
+                    started = perf_counter()
+                    answer = job.solve()
+                    best = min(best, perf_counter() - started)
+            finally:
+                path.unlink(missing_ok=True)
+            result.points.append(ScalingPoint(size, best, str(answer)))
+        return result
+
+
+def format_scaling(result: ScalingResult, max_exponent: float) -> str:
+    lines = [f"Day: {result.day}, Solution {result.part}:"]
+    for point in result.points:
+        lines.append(f"  n={point.size:>10,}  {point.seconds * 1e3:10.2f} ms")
+    exponent = result.exponent
+    if exponent is None:
+        lines.append("  exponent: n/a")
+    else:
+        flag = "  <-- superlinear" if exponent > max_exponent else ""
+        lines.append(f"  exponent: {exponent:.2f} (limit {max_exponent:.2f}){flag}")
+    return "\n".join(lines)
+
+
+__all__ = [
+    "DEFAULT_SIZES",
+    "ScalingBenchmark",
+    "ScalingPoint",
+    "ScalingResult",
+    "fit_exponent",
+    "format_scaling",
+]
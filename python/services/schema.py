@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import functools
+import re
+from array import array
+from dataclasses import make_dataclass
+from enum import Enum
+from itertools import repeat
+from typing import Any, Callable, Iterator, Sequence
+
+from models import Grid
+
+from . import parsers
+
+# A schema is literal text with typed fields, one record per non-blank line:
+#   "{x:int},{y:int},{z:int}"      "{low:int}-{high:int}"
+#   "[{lights:str}] {buttons:ints} {{{joltage:ints}}}"
+# A run of spaces matches any run of spaces or tabs, "{{" and "}}" are literal braces and a
+# field named "_" is matched but not stored.
+_FIELD = re.compile(r"\{\{|\}\}|\{(\w*)(?::(\w+))?\}")
+_INTS = re.compile(r"-?\d+").findall
+_BLOCK_SEPARATOR = re.compile(r"\n[ \t]*(?:\n[ \t]*)+")
+
+
+class FieldType(str, Enum):
+    INT = "int"
+    FLOAT = "float"
+    WORD = "word"
+    CHAR = "char"
+    STR = "str"
+    INTS = "ints"
+
+
+class SectionKind(str, Enum):
+    GRID = "grid"
+    LINES = "lines"
+
+
+_PATTERNS = {
+    FieldType.INT: r"[-+]?\d+",
+    FieldType.FLOAT: r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?",
+    FieldType.WORD: r"\w+",
+    FieldType.CHAR: r"\S",
+    FieldType.STR: r".*?",
+    FieldType.INTS: r".*?",
+}
+
+# Separators containing a digit would be ambiguous inside an int field. Signs are allowed:
+# a "-" separator next to a negative value changes that line's width, which sends the
+# input down the regex path instead.
+_DIGITS = set("0123456789")
+
+
+def _ints(value: str) -> tuple[int, ...]:
+    return tuple(map(int, _INTS(value)))
+
+
+_CONVERTERS: dict[FieldType, Callable[[str], Any]] = {
+    FieldType.INT: int,
+    FieldType.FLOAT: float,
+    FieldType.WORD: str,
+    FieldType.CHAR: str,
+    FieldType.STR: str.strip,
+    FieldType.INTS: _ints,
+}
+
+
+class Table:
+    # Columnar result: int columns are array("q"), float columns array("d"), the rest lists.
+    def __init__(self, schema: "Schema", columns: dict[str, Sequence[Any]], rows: int) -> None:
+        self.schema = schema
+        self.columns = columns
+        self._rows = rows
+
+    def __getattr__(self, name: str) -> Sequence[Any]:
+        try:
+            return self.__dict__["columns"][name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __getitem__(self, name: str) -> Sequence[Any]:
+        return self.columns[name]
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def rows(self) -> list[tuple[Any, ...]]:
+        return list(zip(*self.columns.values()))
+
+    def records(self) -> list[Any]:
+        record = self.schema.record_type
+        return [record(*row) for row in zip(*self.columns.values())]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.records())
+
+
+class Schema:
+    def __init__(self, spec: str, name: str = "Record") -> None:
+        self.spec = spec
+        fields, literals = _tokenize(spec)
+        self.fields = [(field, kind) for field, kind in fields if field != "_"]
+        self._kinds = [kind for _, kind in fields]
+        self._keep = [index for index, (field, _) in enumerate(fields) if field != "_"]
+        self.record_type = make_dataclass(
+            name, [field for field, _ in self.fields], frozen=True, slots=True
+        )
+        self._separator = _split_separator(literals, self._kinds)
+        patterns = [_literal_pattern(literal) for literal in literals]
+        body = "".join(
+            pattern + f"({_PATTERNS[kind]})" for pattern, kind in zip(patterns, self._kinds)
+        )
+        body += patterns[-1]
+        self._line = re.compile(rf"[ \t]*{body}[ \t]*")
+        self._all = re.compile(rf"^[ \t]*{body}[ \t]*$", re.MULTILINE)
+
+    @property
+    def uses_split(self) -> bool:
+        return self._separator is not None
+
+    def parse(self, text: str) -> Table:
+        # Separator-only int schemas split each line; everything else is a single findall of
+        # the compiled multiline pattern. Both accept exactly the same lines.
+        if "\r" in text:
+            text = text.replace("\r\n", "\n")
+        lines = [line for line in text.split("\n") if line.strip()]
+        strings = self._split(lines) if self._separator is not None else None
+        if strings is None:
+            # Matching the joined non-blank lines means blank lines and the trailing newline
+            # never produce empty matches for fields such as {line:str}.
+            raw = self._all.findall("\n".join(lines))
+            if len(self._kinds) == 1:
+                raw = [(value,) for value in raw]
+            if len(raw) != len(lines):
+                self._raise_mismatch(lines)
+            strings = list(zip(*raw)) if raw else [() for _ in self._kinds]
+        try:
+            columns = {
+                field: _column(strings[index], self._kinds[index])
+                for (field, _), index in zip(self.fields, self._keep)
+            }
+        except ValueError:
+            # Only reachable on the split plan, e.g. an empty field or a stray sign.
+            self._raise_mismatch(lines)
+            raise
+        return Table(self, columns, len(lines))
+
+    def parse_line(self, line: str) -> Any:
+        match = self._line.fullmatch(line)
+        if match is None:
+            raise ValueError(f"Line does not match schema {self.spec!r}: {line!r}")
+        values = match.groups()
+        return self.record_type(
+            *(_CONVERTERS[self._kinds[index]](values[index]) for index in self._keep)
+        )
+
+    def _split(self, lines: list[str]) -> list[list[str]] | None:
+        # int() also accepts inner whitespace, "_" and non-ASCII digits, which the regex
+        # rejects, so such input is left to the regex along with any line of the wrong
+        # width. The regex then produces the error message.
+        stripped = [line.strip(" \t") for line in lines]
+        joined = "\n".join(stripped)
+        if not joined.isascii() or " " in joined or "\t" in joined or "_" in joined:
+            return None
+        # Each line's width is checked by counting its separators; with that settled, one
+        # split of the joined lines yields the same tokens as splitting line by line.
+        separator = self._separator
+        width = len(self._kinds)
+        if stripped and set(map(str.count, stripped, repeat(separator))) != {width - 1}:
+            return None
+        flat = joined.replace("\n", separator).split(separator) if stripped else []
+        return [flat[index::width] for index in range(width)]
+
+    def _raise_mismatch(self, lines: list[str]) -> None:
+        for number, line in enumerate(lines, start=1):
+            if not self._line.fullmatch(line):
+                raise ValueError(f"Line {number} does not match schema {self.spec!r}: {line!r}")
+        raise ValueError(f"Input does not match schema {self.spec!r}.")
+
+    def __repr__(self) -> str:
+        return f"Schema({self.spec!r})"
+
+
+def _tokenize(spec: str) -> tuple[list[tuple[str, FieldType]], list[str]]:
+    fields: list[tuple[str, FieldType]] = []
+    literals: list[str] = []
+    literal: list[str] = []
+    position = 0
+    for match in _FIELD.finditer(spec):
+        literal.append(spec[position : match.start()])
+        position = match.end()
+        token = match.group(0)
+        if token in ("{{", "}}"):
+            literal.append(token[0])
+            continue
+        name, kind = match.group(1), match.group(2) or FieldType.STR.value
+        if not name:
+            raise ValueError(f"Schema field {token!r} needs a name (use '_' to skip it).")
+        try:
+            field_type = FieldType(kind)
+        except ValueError:
+            raise ValueError(f"Unknown schema field type {kind!r} in {spec!r}.") from None
+        if name != "_" and any(existing == name for existing, _ in fields):
+            raise ValueError(f"Duplicate schema field {name!r} in {spec!r}.")
+        literals.append("".join(literal))
+        literal = []
+        fields.append((name, field_type))
+    literal.append(spec[position:])
+    literals.append("".join(literal))
+    if not fields:
+        raise ValueError(f"Schema {spec!r} has no fields.")
+    return fields, literals
+
+
+def _literal_pattern(text: str) -> str:
+    return r"[ \t]+".join(re.escape(part) for part in re.split(r"[ \t]+", text))
+
+
+def _split_separator(literals: list[str], kinds: list[FieldType]) -> str | None:
+    # "{a:int},{b:int}" style schemas: one repeated separator, no prefix or suffix, and only
+    # int fields.
+    inner = set(literals[1:-1])
+    if literals[0] or literals[-1] or len(inner) != 1:
+        return None
+    separator = inner.pop()
+    if not separator or any(char.isspace() for char in separator) or set(separator) & _DIGITS:
+        return None
+    if any(kind != FieldType.INT for kind in kinds):
+        return None
+    return separator
+
+
+def _column(values: Sequence[str], kind: FieldType) -> Sequence[Any]:
+    if kind == FieldType.INT:
+        converted = list(map(int, values))
+        try:
+            return array("q", converted)
+        except OverflowError:
+            return converted
+    if kind == FieldType.FLOAT:
+        return array("d", map(float, values))
+    return list(map(_CONVERTERS[kind], values))
+
+
+class Sections:
+    # Blank-line separated blocks, each parsed by its own schema string, Schema or
+    # SectionKind. With repeat=True the parts cycle, e.g. Sections(SectionKind.GRID,
+    # repeat=True) for a file of many grids.
+    def __init__(self, *parts: str | Schema | SectionKind, repeat: bool = False) -> None:
+        if not parts:
+            raise ValueError("Sections need at least one part.")
+        self.parts = [
+            part if isinstance(part, (Schema, SectionKind)) else compile_schema(part)
+            for part in parts
+        ]
+        self.repeat = repeat
+
+    def parse(self, text: str) -> list[Any]:
+        if "\r" in text:
+            text = text.replace("\r\n", "\n")
+        blocks = _BLOCK_SEPARATOR.split(text.strip("\n"))
+        if self.repeat:
+            if len(blocks) % len(self.parts):
+                raise ValueError(
+                    f"Expected a multiple of {len(self.parts)} sections, found {len(blocks)}."
+                )
+        elif len(blocks) != len(self.parts):
+            raise ValueError(f"Expected {len(self.parts)} sections, found {len(blocks)}.")
+        parts = self.parts
+        return [
+            _parse_block(parts[index % len(parts)], block) for index, block in enumerate(blocks)
+        ]
+
+
+def _parse_block(part: Schema | SectionKind, block: str) -> Any:
+    if part == SectionKind.GRID:
+        return Grid([parsers.parse_grid_line(line) for line in block.split("\n") if line.strip()])
+    if part == SectionKind.LINES:
+        return [line for line in block.split("\n") if line.strip()]
+    return part.parse(block)  # type: ignore[union-attr]
+
+
+@functools.lru_cache(maxsize=None)
+def compile_schema(spec: str) -> Schema:
+    return Schema(spec)
+
+
+__all__ = ["FieldType", "Schema", "SectionKind", "Sections", "Table", "compile_schema"]
@@ -1,18 +1,73 @@
 from __future__ import annotations
 
-from typing import Iterable
+import functools
+import os
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING
 
+from helpers.memo import CacheStats, last_solve_memo_stats
 from models import SolutionOptions, SolutionType
-from solutions import ISolution
+from solutions import ISolution, SolutionRegistry
+
+from .file_loader import IFileLoader
+
+if TYPE_CHECKING:
+    # Each mode's module is imported where it is used, so a plain run does not pay for
+    # multiprocessing, sqlite3, tracemalloc, cProfile or the generators.
+    from .answer_store import AnswerKey, AnswerStore
+    from .benchmark import Benchmark, BenchmarkResult
+    from .profiler import ProfileReport, SolveProfiler
+    from .scaling import ScalingBenchmark, ScalingResult
+
+_PARTS = ((1, SolutionType.FIRST), (2, SolutionType.SECOND))
+
+
+def _solve(solution: ISolution) -> tuple[str, list[CacheStats]]:
+    answer = solution.solve()
+    return answer, last_solve_memo_stats()
+
+
+def _execute(solution: ISolution) -> tuple[str, list[CacheStats], bool]:
+    # Days with a budget run in a supervised child process. A breach or failure is reported
+    # in place of the answer so a batch keeps going; the flag says whether it is an answer.
+    budget = solution.current_options.budget_for()
+    if budget.unlimited:
+        return (*_solve(solution), True)
+    from .supervisor import describe_breach, supervise
+
+    result = supervise(functools.partial(_solve, solution), budget)
+    if result.ok:
+        return (*result.value, True)
+    return f"<{describe_breach(result, budget)}>", [], False
+
+
+def _timed_execute(solution: ISolution) -> tuple[str, list[CacheStats], bool, float]:
+    started = perf_counter()
+    answer, stats, ok = _execute(solution)
+    return answer, stats, ok, perf_counter() - started
+
+
+def _print_cache_stats(stats: list[CacheStats]) -> None:
+    for entry in stats:
+        print(f"  Cache {entry.describe()}")
+
+
+def _print_answer(day: int, part: int, answer: str, seconds: float, cached: bool) -> None:
+    source = ", cached" if cached else ""
+    print(f"Day: {day}, Solution {part}: {answer} ({seconds * 1e3:.2f} ms{source})")
 
 
 class SolutionRunner:
-    def __init__(self, solutions: Iterable[ISolution], options: SolutionOptions) -> None:
-        self._solutions = list(solutions)
+    def __init__(
+        self, registry: SolutionRegistry, file_loader: IFileLoader, options: SolutionOptions
+    ) -> None:
+        self._registry = registry
+        self._file_loader = file_loader
         self._options = options
 
     def run(self) -> None:
-        solution = next((s for s in self._solutions if s.day == self._options.day), None)
+        solution = self._find_solution()
         if solution is None:
             print(f"Solution for day {self._options.day} not found.")
             return
@@ -21,13 +76,166 @@ class SolutionRunner:
             f"Day {self._options.day}, {self._options.solution_type.value} part, {self._options.run_type.value} run"
         )
         print(f"https://adventofcode.com/2025/day/{self._options.day}")
-        print(f"Solution: {solution.solve()}")
+        answer, stats, _ = _execute(solution)
+        print(f"Solution: {answer}")
+        _print_cache_stats(stats)
+
+    def run_all(
+        self, workers: int = 1, store: AnswerStore | None = None, refresh: bool = False
+    ) -> None:
+        # With a store, answers whose source closure and input are unchanged are printed
+        # from it with their original timing; refresh recomputes and overwrites them.
+        jobs = self._all_jobs()
+        if store is not None:
+            store.rescan()
+        keys = [store.key(job) if store is not None else None for _, _, job in jobs]
+        cached = [
+            store.get(key) if store is not None and key is not None and not refresh else None
+            for key in keys
+        ]
+        if workers == 1:
+            for (day, part, job), key, hit in zip(jobs, keys, cached):
+                if hit is not None:
+                    _print_answer(day, part, hit.answer, hit.seconds, cached=True)
+                    continue
+                outcome = _timed_execute(job)
+                self._report(store, key, day, part, outcome)
+            return
+
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        # Unbudgeted jobs solve in pool processes, each with its own memo registry.
+        # Budgeted jobs already get a supervised child each, and pool workers cannot start
+        # children of their own, so their threads only wait on those children.
+        max_workers = workers if workers > 0 else os.cpu_count()
+        processes = ProcessPoolExecutor(max_workers)
+        supervisors = ThreadPoolExecutor(max_workers)
+        with processes, supervisors:
+            futures = []
+            for (_, _, job), hit in zip(jobs, cached):
+                if hit is not None:
+                    futures.append(None)
+                    continue
+                unlimited = job.current_options.budget_for().unlimited
+                pool = processes if unlimited else supervisors
+                futures.append(pool.submit(_timed_execute, job))
+            for (day, part, _), key, hit, future in zip(jobs, keys, cached, futures):
+                if future is None:
+                    _print_answer(day, part, hit.answer, hit.seconds, cached=True)
+                    continue
+                self._report(store, key, day, part, future.result())
 
-    def run_all(self) -> None:
-        for solution in sorted(self._solutions, key=lambda s: s.day):
-            self._options.solution_type = SolutionType.FIRST
-            print(f"Day: {solution.day}, Solution 1: {solution.solve()}")
+    def benchmark(self, benchmark: Benchmark, all_days: bool = False) -> list[BenchmarkResult]:
+        from .benchmark import format_result
+
+        results: list[BenchmarkResult] = []
+        for job in self._selected_jobs(all_days):
+            result = benchmark.measure(job)
+            print(format_result(result))
+            results.append(result)
+        return results
+
+    def profile(
+        self, profiler: SolveProfiler, config_seconds: float = 0.0, all_days: bool = False
+    ) -> list[ProfileReport]:
+        from .profiler import format_report
+
+        reports: list[ProfileReport] = []
+        for job in self._selected_jobs(all_days):
+            report = profiler.profile(job, config_seconds)
+            print(format_report(report))
+            reports.append(report)
+        return reports
+
+    def scaling(
+        self, benchmark: ScalingBenchmark, max_exponent: float, all_days: bool = False
+    ) -> list[ScalingResult]:
+        from .scaling import format_scaling
+
+        results: list[ScalingResult] = []
+        for job in self._selected_jobs(all_days):
+            day = job.current_options.day
+            generator = self._registry.generator(day)
+            if generator is None:
+                print(f"Day {day} has no input generator (solutions/dayNN/generator.py).")
+                continue
+            result = benchmark.measure(job, generator)
+            print(format_scaling(result, max_exponent))
+            results.append(result)
+        return results
+
+    def run_corpus(
+        self,
+        source: str,
+        output: Path,
+        workers: int = 1,
+        resume: bool = False,
+        all_parts: bool = False,
+    ) -> None:
+        from .corpus import CorpusRun, completed_files, resolve_corpus
+
+        files = resolve_corpus(source)
+        if not files:
+            print(f"No input files match {source}.")
+            return
+        if self._registry.solution_class(self._options.day) is None:
+            print(f"Solution for day {self._options.day} not found.")
+            return
+
+        part = 1 if self._options.solution_type == SolutionType.FIRST else 2
+        parts = tuple(number for number, _ in _PARTS) if all_parts else (part,)
+        done = completed_files(output, parts) if resume else set()
+        skipped = len({str(path) for path in files} & done)
+        corpus = CorpusRun(self._registry, self._options, parts, workers)
+
+        started = perf_counter()
+        results = errors = 0
+        for result in corpus.run(files, output, resume):
+            results += 1
+            if result.error is not None:
+                errors += 1
+                print(f"Error: {result.file} part {result.part}: {result.error}")
+        print(
+            f"Day {self._options.day} corpus: {len(files) - skipped} inputs, {results} results, "
+            f"{errors} errors, {skipped} skipped in {perf_counter() - started:.2f} s -> {output}"
+        )
+
+    @staticmethod
+    def _report(
+        store: AnswerStore | None,
+        key: AnswerKey | None,
+        day: int,
+        part: int,
+        outcome: tuple[str, list[CacheStats], bool, float],
+    ) -> None:
+        answer, stats, ok, seconds = outcome
+        if store is None:
+            print(f"Day: {day}, Solution {part}: {answer}")
+        else:
+            _print_answer(day, part, answer, seconds, cached=False)
+            if ok and key is not None:
+                store.put(key, str(answer), seconds)
+        _print_cache_stats(stats)
+
+    def _selected_jobs(self, all_days: bool) -> list[ISolution]:
+        if all_days:
+            return [job for _, _, job in self._all_jobs()]
+        solution = self._find_solution()
+        if solution is None:
+            print(f"Solution for day {self._options.day} not found.")
+            return []
+        return [solution]
 
-            self._options.solution_type = SolutionType.SECOND
-            print(f"Day: {solution.day}, Solution 2: {solution.solve()}")
+    def _find_solution(self) -> ISolution | None:
+        return self._registry.create(self._options.day, self._file_loader, self._options)
 
+    def _all_jobs(self) -> list[tuple[int, int, ISolution]]:
+        # Every job gets its own options copy, so no solve ever sees another job's part or day.
+        jobs: list[tuple[int, int, ISolution]] = []
+        for day in self._registry.days():
+            for part, solution_type in _PARTS:
+                options = self._options.copy_with(day=day, solution_type=solution_type)
+                solution = self._registry.create(day, self._file_loader, options)
+                if solution is not None:
+                    jobs.append((day, part, solution))
+        return jobs
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import math
+import multiprocessing
+import os
+import signal
+from dataclasses import dataclass
+from enum import Enum
+from multiprocessing.connection import Connection
+from time import perf_counter
+from typing import Any, Callable
+
+from helpers.progress import set_progress_sink
+from models import SolveBudget
+
+try:
+    import resource
+except ImportError:  # Windows: only the wall-clock limit can be enforced.
+    resource = None  # type: ignore[assignment]
+
+_POLL_INTERVAL = 0.02
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+class SolveStatus(str, Enum):
+    OK = "ok"
+    ERROR = "error"
+    WALL = "wall"
+    CPU = "cpu"
+    MEMORY = "memory"
+
+
+@dataclass
+class SupervisedResult:
+    status: SolveStatus
+    value: Any = None
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_rss_bytes: int = 0
+    progress: str | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == SolveStatus.OK
+
+
+def _read_usage(pid: int) -> tuple[int, float] | None:
+    # (resident bytes, cpu seconds) from /proc; None where /proc is unavailable.
+    try:
+        with open(f"/proc/{pid}/statm", "rb") as handle:
+            resident_pages = int(handle.read().split()[1])
+        with open(f"/proc/{pid}/stat", "rb") as handle:
+            # The command name may contain spaces, so fields are counted after its ')'.
+            fields = handle.read().rsplit(b")", 1)[1].split()
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * _PAGE_SIZE, (int(fields[11]) + int(fields[12])) / _CLOCK_TICKS
+
+
+def _child_main(target: Callable[[], Any], budget: SolveBudget, connection: Connection) -> None:
+    if resource is not None and budget.cpu_seconds is not None:
+        # The kernel sends SIGXCPU at the soft limit; the parent also polls as a backstop.
+        soft = max(1, math.ceil(budget.cpu_seconds))
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, soft + 1))
+    set_progress_sink(lambda message: connection.send(("progress", message)))
+    try:
+        value = target()
+    except BaseException as error:  # noqa: BLE001 - the parent reports every failure
+        connection.send(("error", f"{type(error).__name__}: {error}"))
+        return
+    times = os.times()
+    peak = 0
+    if resource is not None:
+        # ru_maxrss is in kilobytes on Linux.
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    connection.send(("done", value, times.user + times.system, peak))
+
+
+def supervise(target: Callable[[], Any], budget: SolveBudget) -> SupervisedResult:
+    # Runs target() in a child process and kills it as soon as it breaches the budget. The
+    # target and its return value must be picklable where the start method is not fork.
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=_child_main, args=(target, budget, sender))
+    started = perf_counter()
+    process.start()
+    sender.close()
+
+    result = SupervisedResult(SolveStatus.ERROR)
+    memory_limit = budget.memory_mb * 1024 * 1024 if budget.memory_mb is not None else None
+    finished = False
+    try:
+        while not finished:
+            try:
+                while receiver.poll(_POLL_INTERVAL):
+                    message = receiver.recv()
+                    if message[0] == "progress":
+                        result.progress = message[1]
+                        continue
+                    if message[0] == "done":
+                        result.status = SolveStatus.OK
+                        result.value = message[1]
+                        result.cpu_seconds = message[2]
+                        result.peak_rss_bytes = max(result.peak_rss_bytes, message[3])
+                    else:
+                        result.error = message[1]
+                    finished = True
+                    break
+            except EOFError:
+                # The child died without reporting, e.g. killed by SIGXCPU or the OOM killer.
+                process.join()
+                cpu_signal = getattr(signal, "SIGXCPU", None)
+                if cpu_signal is not None and process.exitcode == -cpu_signal:
+                    result.status = SolveStatus.CPU
+                else:
+                    result.error = f"Solve process exited with code {process.exitcode}."
+                break
+            if finished:
+                break
+
+            elapsed = perf_counter() - started
+            usage = _read_usage(process.pid) if process.pid is not None else None
+            if usage is not None:
+                resident, cpu = usage
+                result.peak_rss_bytes = max(result.peak_rss_bytes, resident)
+                result.cpu_seconds = cpu
+                if memory_limit is not None and resident > memory_limit:
+                    result.status = SolveStatus.MEMORY
+                    break
+                if budget.cpu_seconds is not None and cpu > budget.cpu_seconds:
+                    result.status = SolveStatus.CPU
+                    break
+            if budget.wall_seconds is not None and elapsed > budget.wall_seconds:
+                result.status = SolveStatus.WALL
+                break
+    finally:
+        if process.is_alive():
+            process.kill()
+        process.join()
+        receiver.close()
+        result.wall_seconds = perf_counter() - started
+    return result
+
+
+def describe_breach(result: SupervisedResult, budget: SolveBudget) -> str:
+    limits = {
+        SolveStatus.WALL: f"wall time over {budget.wall_seconds} s",
+        SolveStatus.CPU: f"CPU time over {budget.cpu_seconds} s",
+        SolveStatus.MEMORY: f"peak RSS over {budget.memory_mb} MB",
+    }
+    if result.status == SolveStatus.ERROR:
+        summary = f"failed: {result.error}"
+    else:
+        summary = f"stopped, {limits[result.status]}"
+    details = (
+        f" after {result.wall_seconds:.2f} s wall / {result.cpu_seconds:.2f} s CPU, "
+        f"peak RSS {result.peak_rss_bytes / 1024 / 1024:.1f} MB"
+    )
+    progress = f"; last progress: {result.progress}" if result.progress else ""
+    return summary + details + progress
+
+
+__all__ = ["SolveStatus", "SupervisedResult", "describe_breach", "supervise"]
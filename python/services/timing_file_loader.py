@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Iterator, TypeVar
+
+from models import Grid, RunType, SolutionType
+
+from .file_loader import IFileLoader
+
+T = TypeVar("T")
+
+
+class TimingFileLoader(IFileLoader):
+    def __init__(self, inner: IFileLoader) -> None:
+        self._inner = inner
+        self.elapsed = 0.0
+        self.calls = 0
+
+    def reset(self) -> None:
+        self.elapsed = 0.0
+        self.calls = 0
+
+    def data_file_path(self, day: int, solution_type: SolutionType, run_type: RunType) -> Path:
+        return self._inner.data_file_path(day, solution_type, run_type)
+
+    def load_raw(self, day: int, solution_type: SolutionType, run_type: RunType) -> str:
+        return self._timed(self._inner.load_raw, day, solution_type, run_type)
+
+    def load_parsed(
+        self,
+        day: int,
+        solution_type: SolutionType,
+        run_type: RunType,
+        parser: Callable[[str], T],
+    ) -> T:
+        return self._timed(self._inner.load_parsed, day, solution_type, run_type, parser)
+
+    def load_lines(
+        self,
+        day: int,
+        solution_type: SolutionType,
+        run_type: RunType,
+        converter: Callable[[str], T] | None = None,
+    ) -> list[T]:
+        return self._timed(self._inner.load_lines, day, solution_type, run_type, converter)
+
+    def load_grid(
+        self,
+        day: int,
+        solution_type: SolutionType,
+        run_type: RunType,
+        converter: Callable[[str], T] | None = None,
+    ) -> Grid[T]:
+        return self._timed(self._inner.load_grid, day, solution_type, run_type, converter)
+
+    def load_items(
+        self,
+        day: int,
+        solution_type: SolutionType,
+        run_type: RunType,
+        converter: Callable[[str], T] | None = None,
+    ) -> list[list[T]]:
+        return self._timed(self._inner.load_items, day, solution_type, run_type, converter)
+
+    def load_columns(
+        self,
+        day: int,
+        solution_type: SolutionType,
+        run_type: RunType,
+        converter: Callable[[str], T] | None = None,
+    ) -> list[Any]:
+        return self._timed(self._inner.load_columns, day, solution_type, run_type, converter)
+
+    def iter_lines(
+        self,
+        day: int,
+        solution_type: SolutionType,
+        run_type: RunType,
+        converter: Callable[[str], T] | None = None,
+    ) -> Iterator[T]:
+        return self._timed_iter(self._inner.iter_lines(day, solution_type, run_type, converter))
+
+    def iter_items(
+        self,
+        day: int,
+        solution_type: SolutionType,
+        run_type: RunType,
+        converter: Callable[[str], T] | None = None,
+    ) -> Iterator[list[T]]:
+        return self._timed_iter(self._inner.iter_items(day, solution_type, run_type, converter))
+
+    def iter_grid_rows(
+        self,
+        day: int,
+        solution_type: SolutionType,
+        run_type: RunType,
+        converter: Callable[[str], T] | None = None,
+    ) -> Iterator[list[T]]:
+        return self._timed_iter(
+            self._inner.iter_grid_rows(day, solution_type, run_type, converter)
+        )
+
+    def _timed(self, load: Callable[..., T], *args: Any) -> T:
+        started = perf_counter()
+        try:
+            return load(*args)
+        finally:
+            self.elapsed += perf_counter() - started
+            self.calls += 1
+
+    def _timed_iter(self, iterator: Iterator[T]) -> Iterator[T]:
+        # Only the time spent producing each item counts; the caller's loop body does not.
+        self.calls += 1
+        while True:
+            started = perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.elapsed += perf_counter() - started
+                return
+            self.elapsed += perf_counter() - started
+            yield item
+
+
+__all__ = ["TimingFileLoader"]
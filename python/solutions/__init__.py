@@ -1,5 +1,5 @@
 from .isolution import ISolution
+from .registry import SolutionRegistry
 from .solution_base import SolutionBase
 
-__all__ = ["ISolution", "SolutionBase"]
-
+__all__ = ["ISolution", "SolutionBase", "SolutionRegistry"]
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+import random
+
+from helpers.generators import token_rows
+
+
+def generate(size: int, rng: random.Random) -> str:
+    # Two location-ID columns, as in the real input. The narrow ID range guarantees repeats
+    # for the similarity score in part 2.
+    return token_rows(size, rng, columns=2, low=10_000, high=99_999, separator="   ")
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+from models import SolutionOptions
+
+if TYPE_CHECKING:
+    from services import IFileLoader
 
 
 class ISolution(ABC):
@@ -13,3 +19,18 @@ class ISolution(ABC):
     def solve(self) -> str:
         ...
 
+    @property
+    @abstractmethod
+    def current_options(self) -> SolutionOptions:
+        ...
+
+    @property
+    @abstractmethod
+    def file_loader(self) -> IFileLoader:
+        ...
+
+    @abstractmethod
+    def with_options(
+        self, options: SolutionOptions, file_loader: IFileLoader | None = None
+    ) -> "ISolution":
+        ...
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import inspect
+import pkgutil
+import re
+from typing import TYPE_CHECKING
+
+from models import SolutionOptions
+
+from .isolution import ISolution
+
+if TYPE_CHECKING:
+    from helpers.generators import InputGenerator
+    from services import IFileLoader
+
+ENTRY_POINT_GROUP = "advent_of_code.solutions"
+
+_DAY_PACKAGE = re.compile(r"day(\d+)")
+
+
+class SolutionRegistry:
+    def __init__(self, package: str = "solutions") -> None:
+        self._package = package
+        self._locations: dict[int, str] | None = None
+        self._entry_points_loaded = False
+        self._classes: dict[int, type[ISolution]] = {}
+
+    def days(self) -> list[int]:
+        return sorted(self._discover(include_entry_points=True))
+
+    def solution_class(self, day: int) -> type[ISolution] | None:
+        if day in self._classes:
+            return self._classes[day]
+
+        location = self._discover().get(day)
+        if location is None:
+            location = self._discover(include_entry_points=True).get(day)
+        if location is None:
+            return None
+
+        module_name, _, attribute = location.partition(":")
+        module = importlib.import_module(module_name)
+        if attribute:
+            solution_class = getattr(module, attribute)
+        else:
+            solution_class = self._find_solution_class(module)
+        self._classes[day] = solution_class
+        return solution_class
+
+    def create(
+        self, day: int, file_loader: "IFileLoader", options: SolutionOptions
+    ) -> ISolution | None:
+        solution_class = self.solution_class(day)
+        if solution_class is None:
+            return None
+        return solution_class(file_loader, options)  # type: ignore[call-arg]
+
+    def generator(self, day: int) -> "InputGenerator | None":
+        # A day opts in to synthetic inputs with a sibling generator module exposing
+        # generate(size, rng); see helpers.generators.
+        location = self._discover(include_entry_points=True).get(day)
+        if location is None:
+            return None
+        module_name = f"{location.partition(':')[0]}.generator"
+        try:
+            if importlib.util.find_spec(module_name) is None:
+                return None
+        except ModuleNotFoundError:
+            return None
+        return getattr(importlib.import_module(module_name), "generate", None)
+
+    def _discover(self, include_entry_points: bool = False) -> dict[int, str]:
+        # Only names are collected here; nothing below the package itself is imported.
+        if self._locations is None:
+            self._locations = {}
+            package = importlib.import_module(self._package)
+            for module_info in pkgutil.iter_modules(package.__path__):
+                match = _DAY_PACKAGE.fullmatch(module_info.name)
+                if module_info.ispkg and match:
+                    self._locations[int(match.group(1))] = f"{self._package}.{module_info.name}"
+
+        # Scanning installed distributions is comparatively slow, so it only happens when a
+        # day is not found locally or the full list is requested.
+        if include_entry_points and not self._entry_points_loaded:
+            from importlib import metadata
+
+            for entry_point in metadata.entry_points(group=ENTRY_POINT_GROUP):
+                if entry_point.name.isdigit():
+                    self._locations.setdefault(int(entry_point.name), entry_point.value)
+            self._entry_points_loaded = True
+
+        return self._locations
+
+    @staticmethod
+    def _find_solution_class(module: object) -> type[ISolution]:
+        names = getattr(module, "__all__", None) or dir(module)
+        for name in names:
+            candidate = getattr(module, name)
+            if (
+                isinstance(candidate, type)
+                and issubclass(candidate, ISolution)
+                and not inspect.isabstract(candidate)
+            ):
+                return candidate
+        raise LookupError(f"{getattr(module, '__name__', module)} does not export a solution class.")
+
+
+__all__ = ["ENTRY_POINT_GROUP", "SolutionRegistry"]
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import functools
 from abc import ABC, abstractmethod
-from typing import Callable, TypeVar
+from array import array
+from typing import Any, Callable, Iterator, TypeVar
 
-from models import Grid, RunType, SolutionOptions, SolutionType
-from services import IFileLoader
+from helpers.memo import release_solve_memos, reset_solve_memos
+from helpers.progress import report_progress
+from models import CompactGrid, Grid, RunType, SolutionOptions, SolutionType
+from services import IFileLoader, Schema, Sections, compile_schema
 
 from .isolution import ISolution
 
@@ -12,6 +16,24 @@ T = TypeVar("T")
 
 
 class SolutionBase(ISolution, ABC):
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        # Every concrete solve() starts with empty solve_memo caches and releases them when it
+        # finishes, so nothing leaks between runs or stays alive in long-lived workers.
+        super().__init_subclass__(**kwargs)
+        solve = cls.__dict__.get("solve")
+        if solve is None or getattr(solve, "__isabstractmethod__", False):
+            return
+
+        @functools.wraps(solve)
+        def solve_with_fresh_memos(self: SolutionBase) -> str:
+            reset_solve_memos()
+            try:
+                return solve(self)
+            finally:
+                release_solve_memos()
+
+        cls.solve = solve_with_fresh_memos  # type: ignore[method-assign]
+
     def __init__(self, file_loader: IFileLoader, options: SolutionOptions) -> None:
         self._file_loader = file_loader
         self._options = options
@@ -20,6 +42,19 @@ class SolutionBase(ISolution, ABC):
     def current_options(self) -> SolutionOptions:
         return self._options
 
+    @property
+    def file_loader(self) -> IFileLoader:
+        return self._file_loader
+
+    def with_options(
+        self, options: SolutionOptions, file_loader: IFileLoader | None = None
+    ) -> "SolutionBase":
+        return type(self)(file_loader or self._file_loader, options)
+
+    def report_progress(self, message: str) -> None:
+        # Shown by the runner when a supervised solve breaches its budget; a no-op otherwise.
+        report_progress(message)
+
     def load_raw(self) -> str:
         return self._file_loader.load_raw(
             self._options.day, self._options.solution_type, self._options.run_type
@@ -41,6 +76,9 @@ class SolutionBase(ISolution, ABC):
             converter,
         )
 
+    def load_compact_grid(self, converter: Callable[[str], T] | None = None) -> CompactGrid[T]:
+        return CompactGrid.from_grid(self.load_grid(converter))
+
     def load_items(self, converter: Callable[[str], T] | None = None) -> list[list[T]]:
         return self._file_loader.load_items(
             self._options.day,
@@ -49,6 +87,46 @@ class SolutionBase(ISolution, ABC):
             converter,
         )
 
+    def load_columns(self, converter: Callable[[str], T] | None = None) -> list[array | list[T]]:
+        return self._file_loader.load_columns(
+            self._options.day,
+            self._options.solution_type,
+            self._options.run_type,
+            converter,
+        )
+
+    def load_schema(self, schema: str | Schema | Sections) -> Any:
+        # A schema string gives a columnar Table; Sections gives one result per block.
+        # Parsing runs inside the loader, so timing loaders count it as input, not solve.
+        parser = compile_schema(schema) if isinstance(schema, str) else schema
+        return self._file_loader.load_parsed(
+            self._options.day, self._options.solution_type, self._options.run_type, parser.parse
+        )
+
+    def iter_lines(self, converter: Callable[[str], T] | None = None) -> Iterator[T]:
+        return self._file_loader.iter_lines(
+            self._options.day,
+            self._options.solution_type,
+            self._options.run_type,
+            converter,
+        )
+
+    def iter_items(self, converter: Callable[[str], T] | None = None) -> Iterator[list[T]]:
+        return self._file_loader.iter_items(
+            self._options.day,
+            self._options.solution_type,
+            self._options.run_type,
+            converter,
+        )
+
+    def iter_grid_rows(self, converter: Callable[[str], T] | None = None) -> Iterator[list[T]]:
+        return self._file_loader.iter_grid_rows(
+            self._options.day,
+            self._options.solution_type,
+            self._options.run_type,
+            converter,
+        )
+
     @property
     @abstractmethod
     def day(self) -> int: